@@ -0,0 +1,19 @@
+# Prints each alias name read from stdin (one per line) which begins with the
+# prefix given as the only operand. The names must be sorted, so that reading
+# can stop as soon as they no longer match.
+
+BEGIN {
+  prefix = ARGV[1]
+  delete ARGV[1]
+}
+
+index($0, prefix) == 1 {
+  print
+  matched = 1
+
+  next
+}
+
+matched {
+  exit
+}
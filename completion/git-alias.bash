@@ -0,0 +1,68 @@
+# Bash completion for the `git alias` and `git unalias` subcommands.
+#
+# Git's own completion script (which must be loaded first) calls these functions
+# when completing those subcommands. Alias names are completed using
+# `git-alias --complete`, which reads them from a cached index.
+
+## Completes the names of aliases in the location given by any flags on the
+## command line.
+__git_alias_complete_names() {
+  local i location=()
+
+  for ((i = 2; i < cword; i++)); do
+    case "${words[i]}" in
+      --global | --local | --system | --worktree ) location+=("${words[i]}");;
+      --file ) location+=(--file "${words[i + 1]}"); ((i++));;
+
+      # Aliases are moved from the location given by --from.
+      --from )
+        case "${words[i + 1]}" in
+          --* ) location+=("${words[i + 1]}");;
+          * ) location+=(--file "${words[i + 1]}");;
+        esac
+
+        ((i++))
+      ;;
+
+      --format | --sync-from | --to ) ((i++));;
+    esac
+  done
+
+  __gitcomp_nl "$(git-alias "${location[@]}" --complete "$cur" 2> /dev/null)"
+}
+
+_git_alias() {
+  local i names_only= positional=0
+
+  case "$cur" in
+    --* )
+      __gitcomp "--batch --complete --config --config-no-header --dry-run
+        --effective --file --format --from --global --import --includes --json
+        --json-compact --local --match --move --names-only --ndjson --null
+        --shell --show --sync-from --system --to --worktree"
+
+      return
+    ;;
+  esac
+
+  for ((i = 2; i < cword; i++)); do
+    case "${words[i]}" in
+      --file | --format | --from | --sync-from | --to ) ((i++));;
+      --match | --move | --show ) names_only=1;;
+      --* ) ;;
+      * ) ((positional++));;
+    esac
+  done
+
+  # When defining an alias, only its name (the first parameter) is one.
+  if [ -n "$names_only" ] || [ "$positional" -eq 0 ]; then
+    __git_alias_complete_names
+  fi
+}
+
+_git_unalias() {
+  case "$cur" in
+    --* ) __gitcomp "--all-scopes --dry-run --file --global --local --system --worktree";;
+    * ) __git_alias_complete_names;;
+  esac
+}
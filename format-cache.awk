@@ -0,0 +1,6 @@
+## Prints the supplied alias name and body in the same form as `git config
+## --null --get-regexp`, which is how aliases are stored in the cache (so that
+## parse-aliases.awk can read them back).
+function handle(name, body) {
+  printf "alias.%s\n%s%c", name, body, 0
+}
@@ -1,12 +1,48 @@
 ## Prints the supplied alias name and body as lines for a Git configuration
-## file. The desired indent, if any, must be supplied.
-function handle(name, body) {
+## file. The desired indent and section header, if any, must be supplied. If
+## `effective` is set, each definition it shadows is printed first (commented
+## out) and every definition is preceded by a comment saying where it came from.
+function handle(name, body,    i) {
+  print_header()
+
+  if (effective) {
+    for (i = 1; i <= shadowed_count; i++) {
+      print comment(shadowed_scope[i] " " shadowed_origin[i] " (shadowed)")
+      print comment(name " = " quote(shadowed_body[i]))
+    }
+
+    print comment(alias_scope " " alias_origin)
+  }
+
   print indent name " = " quote(body)
 }
 
+## Turn any string into an (indented) Git configuration file comment, which
+## spans as many lines as it does.
+function comment(string) {
+  gsub(/\n/, "\n" indent "# ", string)
+
+  return indent "# " string
+}
+
+## Prints the section header, if there is one and it hasn't been printed yet.
+## This is delayed until there is something to print, so that nothing at all is
+## printed if an error is reported before then.
+function print_header() {
+  if (header != "") {
+    print header
+
+    header = ""
+  }
+}
+
+END {
+  print_header()
+}
+
 ## Turn any string into a gitconfig-style double-quoted string.
 function quote(string) {
-  gsub(/\\/, "\\\\", string)
+  gsub(/\\/, "&&", string)
   gsub(/\n/, "\\n", string)
   gsub(/"/, "\\\"", string)
 
@@ -1,14 +1,43 @@
 BEGIN {
-  printf "{"
-
   is_first = 1
+
+  # The escape sequence for each character which must be escaped in a JSON
+  # string, for use by `quote()`. Control characters without a short escape
+  # sequence of their own are written as Unicode escape sequences.
+  for (i = 1; i < 32; i++) {
+    escapes[sprintf("%c", i)] = sprintf("\\u%04x", i)
+  }
+
+  escapes["\b"] = "\\b"
+  escapes["\t"] = "\\t"
+  escapes["\n"] = "\\n"
+  escapes["\f"] = "\\f"
+  escapes["\r"] = "\\r"
+  escapes["\""] = "\\\""
+  escapes["\\"] = "\\\\"
 }
 
-## Stores the supplied alias name and body as an array index and element, to be
-## processed by the END block just below it. It also tracks the size of the
-## array in `alias_count`.
+## Prints the supplied alias name and body as a member of the JSON object. The
+## opening brace is printed along with the first member (or by the END block, if
+## there are none), so that nothing at all is printed if an error is reported
+## before then.
+##
+## If `effective` is set, the member's value is an object describing the
+## definition and where it came from, including any definitions it shadows,
+## rather than just the body.
+##
+## If `style` is "ndjson", each alias is instead printed immediately as an
+## object of its own (see `print_line`), rather than as part of a larger one.
 function handle(name, body) {
+  if (style == "ndjson") {
+    print_line(name, body)
+
+    return
+  }
+
   if (is_first) {
+    printf "{"
+
     is_first = 0
   } else {
     printf ","
@@ -23,68 +52,131 @@ function handle(name, body) {
 
   if (is_pretty()) printf " "
 
-  printf quote(body)
+  if (effective) {
+    print_definition(body, alias_scope, alias_origin, 1, 1)
+  } else {
+    printf "%s", quote(body)
+  }
 }
 
-## Determines whether to pretty-print the JSON output. If the variable `style`
-## is set to exactly "compact", no optional whitespace before or after elements
-# will be emitted. Any other value will be treated as "pretty", and produce more
-# human-friendly output.
-function is_pretty() {
-  return style != "compact"
-}
+## Prints an object describing one definition of an alias, which is nested
+## `depth` levels deep. The definitions it shadows are only included if
+## `with_shadowed` is set.
+function print_definition(body, scope, origin, depth, with_shadowed,    i) {
+  printf "{"
 
-END {
-  if (is_pretty() && !is_first) {
-    printf "\n"
+  print_member("body", body, depth + 1, 1)
+  print_member("scope", scope, depth + 1)
+  print_member("origin", origin, depth + 1)
+
+  if (with_shadowed) {
+    print_shadowed(depth + 1)
   }
 
+  print_break(depth)
   printf "}"
+}
 
+## Prints the "shadowed" member of an object describing an alias's effective
+## definition, which is nested `depth` levels deep.
+function print_shadowed(depth,    i) {
+  printf ","
+  print_break(depth)
+  printf "\"shadowed\":%s[", (is_pretty() ? " " : "")
+
+  for (i = 1; i <= shadowed_count; i++) {
+    if (i > 1) printf ","
+
+    print_break(depth + 1)
+    print_definition(shadowed_body[i], shadowed_scope[i], shadowed_origin[i], depth + 1, 0)
+  }
+
+  if (shadowed_count) print_break(depth)
+
+  printf "]"
+}
+
+## Prints the supplied alias name and body as a complete JSON document on a line
+## of its own, so that consumers can process each alias as soon as it arrives.
+## Where the definition came from is included if `effective` is set.
+function print_line(name, body) {
+  printf "{\"name\":\"%s\",\"body\":%s", name, quote(body)
+
+  if (effective) {
+    print_member("scope", alias_scope, 0)
+    print_member("origin", alias_origin, 0)
+    print_shadowed(0)
+  }
+
+  printf "}\n"
+}
+
+## Prints a member of an object whose value is a string, which is nested `depth`
+## levels deep. Unless `is_first_member` is set, it is preceded by a comma.
+function print_member(key, value, depth, is_first_member) {
+  if (!is_first_member) printf ","
+
+  print_break(depth)
+  printf "\"%s\":%s%s", key, (is_pretty() ? " " : ""), quote(value)
+}
+
+## Starts a new line indented to the given depth, if pretty-printing.
+function print_break(depth,    i) {
   if (is_pretty()) {
     printf "\n"
+
+    for (i = 0; i < depth; i++) printf "  "
+  }
+}
+
+## Determines whether to pretty-print the JSON output. If the variable `style`
+## is set to exactly "compact" or "ndjson", no optional whitespace before or
+## after elements will be emitted. Any other value will be treated as "pretty",
+## and produce more human-friendly output.
+function is_pretty() {
+  return style != "compact" && style != "ndjson"
+}
+
+END {
+  # With the "ndjson" style, each alias has already been printed as a complete
+  # document.
+  if (style != "ndjson") {
+    if (is_first) {
+      printf "{"
+    } else if (is_pretty()) {
+      printf "\n"
+    }
+
+    printf "}"
+
+    if (is_pretty()) {
+      printf "\n"
+    }
   }
 }
 
-## Turn any string into a valid JSON double-quoted string.
-function quote(string) {
-  gsub(/\\/, "\\\\", string)
-  gsub(/"/, "\\\"", string)
-
-  # I'm sure there's a smarter way to do this, but I spent two hours getting
-  # more and more annoyed at awk while trying to figure it out before giving up
-  # and doing it the easy way.
-  gsub(/\001/, "\\u0001", string)
-  gsub(/\002/, "\\u0002", string)
-  gsub(/\003/, "\\u0003", string)
-  gsub(/\004/, "\\u0004", string)
-  gsub(/\005/, "\\u0005", string)
-  gsub(/\006/, "\\u0006", string)
-  gsub(/\007/, "\\u0007", string)
-  gsub(/\b/, "\\b", string)
-  gsub(/\t/, "\\t", string)
-  gsub(/\n/, "\\n", string)
-  gsub(/\013/, "\\u000b", string)
-  gsub(/\f/, "\\f", string)
-  gsub(/\r/, "\\r", string)
-  gsub(/\016/, "\\u000e", string)
-  gsub(/\017/, "\\u000f", string)
-  gsub(/\020/, "\\u0010", string)
-  gsub(/\021/, "\\u0011", string)
-  gsub(/\022/, "\\u0012", string)
-  gsub(/\023/, "\\u0013", string)
-  gsub(/\024/, "\\u0014", string)
-  gsub(/\025/, "\\u0015", string)
-  gsub(/\026/, "\\u0016", string)
-  gsub(/\027/, "\\u0017", string)
-  gsub(/\030/, "\\u0018", string)
-  gsub(/\031/, "\\u0019", string)
-  gsub(/\032/, "\\u001a", string)
-  gsub(/\033/, "\\u001b", string)
-  gsub(/\034/, "\\u001c", string)
-  gsub(/\035/, "\\u001d", string)
-  gsub(/\036/, "\\u001e", string)
-  gsub(/\037/, "\\u001f", string)
+## Turn any string into a valid JSON double-quoted string. Strings which don't
+## contain any characters which need to be escaped (as most alias bodies don't)
+## are returned as-is, and otherwise only the characters actually present are
+## replaced, each in a single pass over the string.
+function quote(string,    char) {
+  if (!match(string, /[\001-\037"\\]/)) {
+    return "\"" string "\""
+  }
+
+  # Backslashes must be escaped first, so that those in the escape sequences
+  # which follow aren't.
+  if (index(string, "\\")) gsub(/\\/, "&&", string)
+  if (index(string, "\"")) gsub(/"/, "\\\"", string)
+  if (index(string, "\n")) gsub(/\n/, "\\n", string)
+  if (index(string, "\t")) gsub(/\t/, "\\t", string)
+
+  # Any other control characters are rare, so are looked up in the table of
+  # escape sequences, one kind at a time.
+  while (match(string, /[\001-\037]/)) {
+    char = substr(string, RSTART, 1)
+    gsub(char, escapes[char], string)
+  }
 
   return "\"" string "\""
 }
@@ -0,0 +1,5 @@
+## Prints the supplied alias name and body as two NUL-terminated fields. As
+## neither can contain a NUL character, nothing needs to be quoted or escaped.
+function handle(name, body) {
+  printf "%s%c%s%c", name, 0, body, 0
+}
@@ -1,8 +1,26 @@
-## Prints the supplied alias name and body as an invocation of `git alias`.
-function handle(name, body) {
+## Prints the supplied alias name and body as an invocation of `git alias`. If
+## `effective` is set, each definition it shadows is printed first (commented
+## out) and every definition is preceded by a comment saying where it came from.
+function handle(name, body,    i) {
+  if (effective) {
+    for (i = 1; i <= shadowed_count; i++) {
+      print comment(shadowed_scope[i] " " shadowed_origin[i] " (shadowed)")
+      print comment("git alias " name " " quote(shadowed_body[i]))
+    }
+
+    print comment(alias_scope " " alias_origin)
+  }
+
   print "git alias " name " " quote(body)
 }
 
+## Turn any string into a shell comment, which spans as many lines as it does.
+function comment(string) {
+  gsub(/\n/, "\n# ", string)
+
+  return "# " string
+}
+
 ## Turn any string into a shell-style single-quoted string.
 function quote(string) {
   gsub(/'/, "'\\''", string)
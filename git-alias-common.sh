@@ -0,0 +1,265 @@
+# Helpers shared by git-alias.sh and git-unalias.sh, which load this file (see
+# their `load_common` functions) once they've set `trace_category` to the
+# category their trace events belong to. `clear_cache` also needs `cache_dir`.
+
+# Tracing is enabled by setting GIT_ALIAS_TRACE to "1", "2", or "true" (to write
+# events to stderr) or to an absolute path (to append them to that file), like
+# Git's own GIT_TRACE.
+case "$GIT_ALIAS_TRACE" in
+  1 | 2 | true ) trace=stderr;;
+  /* ) trace="$GIT_ALIAS_TRACE";;
+  * ) trace=;;
+esac
+
+trace_clocks=0
+trace_depth=0
+trace_tid=1
+
+## Writes a trace event (a single line of JSON) to the trace's destination.
+trace_write() {
+  if [ "$trace" = stderr ]; then
+    printf '%s\n' "$1" >&2
+  else
+    printf '%s\n' "$1" >> "$trace"
+  fi
+}
+
+## Stores the current time, in microseconds since the epoch, in `trace_now`.
+## This starts a process, so calls are counted in `trace_clocks` to keep them
+## out of the number of processes each phase is reported to have started.
+trace_clock() {
+  trace_now="$(date +%s%N)"
+  trace_clocks=$((trace_clocks + 1))
+
+  case "$trace_now" in
+    # Not every `date` supports nanoseconds, in which case only whole seconds
+    # are available.
+    *[!0-9]* ) trace_now="${trace_now%%[!0-9]*}000000";;
+    * ) trace_now="${trace_now%???}";;
+  esac
+}
+
+## Stores the ID of the most recently started process in `trace_last_pid`, if
+## Linux makes it available (without starting a process to read it).
+trace_read_last_pid() {
+  trace_last_pid=
+
+  if [ -r /proc/loadavg ]; then
+    read -r trace_unused trace_unused trace_unused trace_unused trace_last_pid < /proc/loadavg
+  fi
+}
+
+## Begins a traced phase with the given name. Phases may be nested, and each
+## must be ended by `trace_end`.
+trace_begin() {
+  if [ -z "$trace" ]; then
+    return 0
+  fi
+
+  trace_clock
+  trace_write "{\"name\":\"$1\",\"cat\":\"$trace_category\",\"ph\":\"B\",\"ts\":$trace_now,\"pid\":$$,\"tid\":$trace_tid}"
+  trace_read_last_pid
+
+  trace_depth=$((trace_depth + 1))
+  eval "trace_name_$trace_depth=\$1 trace_first_pid_$trace_depth=\$trace_last_pid trace_first_clock_$trace_depth=\$trace_clocks"
+}
+
+## Ends the most recently begun traced phase, recording roughly how many
+## processes were started while it ran. This is only an approximation: it is
+## worked out from the most recently allocated process ID, so it counts every
+## process started on the whole machine in the meantime (other than those used
+## to trace phases nested within it in the same shell), not only this script's.
+## It's left out if process IDs wrapped around, as it would be meaningless.
+trace_end() {
+  if [ -z "$trace" ]; then
+    return 0
+  fi
+
+  trace_read_last_pid
+  eval "trace_name=\$trace_name_$trace_depth trace_first_pid=\$trace_first_pid_$trace_depth trace_first_clock=\$trace_first_clock_$trace_depth"
+  trace_depth=$((trace_depth - 1))
+  trace_args=
+
+  if [ -n "$trace_last_pid" ] && [ -n "$trace_first_pid" ]; then
+    trace_processes=$((trace_last_pid - trace_first_pid - (trace_clocks - trace_first_clock)))
+
+    if [ "$trace_processes" -ge 0 ]; then
+      trace_args=",\"args\":{\"approx_system_processes\":$trace_processes}"
+    fi
+  fi
+
+  trace_clock
+  trace_write "{\"name\":\"$trace_name\",\"cat\":\"$trace_category\",\"ph\":\"E\",\"ts\":$trace_now,\"pid\":$$,\"tid\":$trace_tid$trace_args}"
+}
+
+## Runs the command given by the remaining parameters as a traced phase named by
+## the first, returning its exit status.
+traced() {
+  trace_begin "$1"
+  shift
+
+  "$@"
+  trace_status=$?
+
+  trace_end
+
+  return $trace_status
+}
+
+if [ -n "$trace" ]; then
+  # Name the process, so that traces of several runs can be told apart.
+  trace_write "{\"name\":\"process_name\",\"ph\":\"M\",\"pid\":$$,\"args\":{\"name\":\"$trace_category\"}}"
+fi
+
+## Follows the symlink(s) at the given path, storing the path of the file they
+## ultimately point to in `resolved_path`.
+##
+## This doesn't fork any processes unless the path actually is a symlink (when
+## `readlink`, which isn't a shell built-in, is needed to read its target) and
+## doesn't canonicalize the result; relative targets are simply appended to the
+## directory containing the link, which the kernel will resolve the same way.
+resolve_symlinks() {
+  resolved_path="$1"
+
+  # Give up after as many links as Linux will follow before reporting ELOOP.
+  links_left=40
+
+  while [ -h "$resolved_path" ]; do
+    links_left=$((links_left - 1))
+
+    if [ "$links_left" -eq 0 ]; then
+      >&2 echo "Too many levels of symbolic links while resolving \"$1\"."
+
+      exit 1
+    fi
+
+    if ! link_target="$(readlink "$resolved_path")"; then
+      >&2 echo "Couldn't resolve \"$resolved_path\" while resolving \"$1\"."
+
+      exit 1
+    fi
+
+    case "$link_target" in
+      /* ) resolved_path="$link_target";;
+      * ) dirname_of "$resolved_path"; resolved_path="$dirname/$link_target";;
+    esac
+  done
+}
+
+## Stores the directory portion of the given path in `dirname`, like the
+## `dirname` command (but without forking a process to run it).
+dirname_of() {
+  case "$1" in
+    */* ) dirname="${1%/*}"; dirname="${dirname:-/}";;
+    * ) dirname=.;;
+  esac
+}
+
+## Stores the concatenated contents of the named awk scripts, which are kept in
+## `script_dir`, in `awk_program`.
+##
+## The bundled versions of the scripts (see the Makefile) replace this function
+## with one which has all of the awk scripts built in.
+load_awk() {
+  trace_begin load-awk
+  awk_program=
+
+  for awk_script in "$@"; do
+    awk_program="$awk_program
+$(cat "$script_dir/$awk_script")"
+  done
+
+  trace_end
+}
+
+## Converts the default file location into a valid command-line flag for Git.
+## If a flag or custom file is configured, use that. Otherwise, fall back to the
+## global file.
+resolve_location() {
+  if [ "$where" = default ]; then
+    trace_begin resolve-location
+    configured_location="$(git config --get git-alias.config-file)"
+
+    case "$configured_location" in
+      "" ) where=--global;;
+      --global | --local | --system | --worktree ) where="$configured_location";;
+      "--file "* ) where="${configured_location#--file }";;
+      * ) where="$configured_location";;
+    esac
+
+    trace_end
+  fi
+}
+
+## Prints the path of the configuration file used by the location in `$where`,
+## following symlinks the same way Git does when writing to it.
+config_file_path() {
+  trace_begin config-file-path
+
+  case "$where" in
+    --global )
+      # Git only uses the XDG location if the traditional one doesn't exist.
+      xdg_config="${XDG_CONFIG_HOME:-$HOME/.config}/git/config"
+
+      if [ -n "$GIT_CONFIG_GLOBAL" ]; then
+        config_file="$GIT_CONFIG_GLOBAL"
+      elif [ ! -f "$HOME/.gitconfig" ] && [ -f "$xdg_config" ]; then
+        config_file="$xdg_config"
+      else
+        config_file="$HOME/.gitconfig"
+      fi
+    ;;
+
+    # Git can't be asked for the path of any other location directly, but it
+    # will pass it to the "editor".
+    --* ) config_file="$(GIT_EDITOR=echo git -c advice.waitingForEditor=false config "$where" --edit)" || return 1;;
+    * ) config_file="$where";;
+  esac
+
+  resolve_symlinks "$config_file"
+  trace_end
+
+  echo "$resolved_path"
+}
+
+## Takes the same lock Git itself uses for the configuration file at the given
+## path, storing the lock file's path in `lock_file`. Fails if the file is
+## already locked.
+##
+## The lock file replaces the configuration file once written, so it's given the
+## same permissions first (as Git's own lock is) by copying the file over it.
+## Global configuration files often hold credentials, so mustn't become any more
+## readable when they're rewritten. The new contents must therefore be written
+## over the lock file, rather than in place of it.
+lock_config_file() {
+  lock_file="$1.lock"
+
+  # With noclobber set, the redirection fails if the lock file already exists.
+  # (`true` is used rather than `:` because a failed redirection on a special
+  # built-in would make the shell exit.)
+  set -C
+
+  if ! { true > "$lock_file"; } 2> /dev/null; then
+    set +C
+
+    >&2 echo "Could not lock config file \"$1\"."
+
+    return 1
+  fi
+
+  set +C
+
+  if [ -e "$1" ] && ! cp -p "$1" "$lock_file"; then
+    rm -f "$lock_file"
+
+    return 1
+  fi
+}
+
+## Removes all of the aliases cached by `git alias` (see `update_cache`), as
+## they may no longer be accurate.
+clear_cache() {
+  if [ -d "$cache_dir" ]; then
+    rm -rf "$cache_dir"
+  fi
+}
@@ -8,13 +8,31 @@ beginswith() {
   return 1
 }
 
+cache_dir="${XDG_CACHE_HOME:-$HOME/.cache}/git-alias"
+dry_run=
 format=default
+import_format=shell
+includes=
+mode=default
 where=default
 
 while true; do
   case "$1" in
-    --config | --config-no-header | --json | --json-compact | --names-only | --shell ) format=$1;;
+    --batch ) mode=batch;;
+    --complete ) mode=complete;;
+    --config | --config-no-header | --json | --json-compact | --names-only | --ndjson | --null | --shell ) format=$1;;
+    --dry-run ) dry_run="[dry-run] ";;
+    --effective ) where=--effective;;
     --file ) where="$2"; shift;;
+    --format ) import_format="$2"; shift;;
+    --from ) move_from="$2"; shift;;
+    --import ) mode=import;;
+    --includes ) includes=1;;
+    --match ) mode=match;;
+    --move ) mode=move;;
+    --show ) mode=show;;
+    --sync-from ) mode=sync; sync_source="$2"; shift;;
+    --to ) move_to="$2"; shift;;
     --global | --local | --system | --worktree ) where=$1;;
     -- ) shift; break;;
     *) break;;
@@ -23,81 +41,597 @@ while true; do
   shift
 done
 
-# Convert the default file location into a valid command-line flag for Git. If a
-# flag or custom file is configured, use that. Otherwise, fall back to the
-# global file.
-if [ "$where" = default ]; then
-  configured_location="$(git config --get git-alias.config-file)"
-
-  case "$configured_location" in
-    "" ) where=--global;;
-    --global | --local | --system | --worktree ) where="$configured_location";;
-    "--file "* ) where="$(echo "$configured_location" | cut -c 8-)";;
-    * ) where="$configured_location";;
-  esac
+# Only syncing can report the changes it would make without making them, so
+# anything else would make its changes for real despite the flag.
+if [ -n "$dry_run" ] && [ "$mode" != sync ]; then
+  >&2 echo "--dry-run can only be used with --sync-from."
+
+  exit 1
 fi
 
-if [ $# -gt 1 ]; then
-  # Define an alias.
+trace_category=git-alias
+
+## Loads the helpers shared with git-unalias from git-alias-common.sh, which is
+## kept alongside the awk scripts in the directory containing this script. That
+## directory is stored in `script_dir`, following any symlinks to this script
+## the same way as `resolve_symlinks` (which can't be used until the helpers are
+## loaded). Setting GIT_ALIAS_HOME to the directory skips resolving it from
+## `$0`.
+##
+## The bundled version of this script (see the Makefile) replaces this function
+## with the helpers themselves.
+load_common() {
+  script_dir="$GIT_ALIAS_HOME"
+
+  if [ -z "$script_dir" ]; then
+    # Giving the path a directory means there's always one to take off of it.
+    case "$0" in
+      */* ) script_path="$0";;
+      * ) script_path="./$0";;
+    esac
 
-  if [ "$format" != default ]; then
-    >&2 echo "Format flags have no meaning when creating an alias."
+    links_left=40
+
+    while [ -h "$script_path" ]; do
+      links_left=$((links_left - 1))
+
+      if [ "$links_left" -eq 0 ]; then
+        >&2 echo "Too many levels of symbolic links while resolving \"$0\"."
+
+        exit 1
+      fi
+
+      link_target="$(readlink "$script_path")" || exit 1
+
+      case "$link_target" in
+        /* ) script_path="$link_target";;
+        * ) script_path="${script_path%/*}/$link_target";;
+      esac
+    done
+
+    script_dir="${script_path%/*}"
   fi
 
-  name="$1"
-  shift
+  . "$script_dir/git-alias-common.sh"
+}
 
-  # Using "$*" here allows commands like `git alias cdiff diff --cached` to work
-  # as expected by combining all the arguments after the alias name into a
-  # single string.
+load_common
+
+## Rewrites the configuration file used by the location in `$where` in a single
+## step, under the same lock Git itself uses. The awk scripts named by the
+## parameters are run with the file's path as their only operand and must print
+## its new contents. Anything they write to file descriptor 3 goes to stdout.
+rewrite_config_file() {
+  config_file="$(config_file_path)" || exit 1
+
+  lock_config_file "$config_file" || exit 1
+
+  trap 'rm -f "$lock_file"' EXIT
+  trap 'exit 1' HUP INT TERM
+
+  load_awk "$@"
+
+  # The awk scripts are run in the C locale, as they work with bytes rather than
+  # characters (parse-json.awk, for example, writes UTF-8 one byte at a time).
+  traced rewrite env LC_ALL=C awk "$awk_program" "$config_file" 3>&1 > "$lock_file" || exit 1
+  mv -f "$lock_file" "$config_file" || exit 1
+
+  trap - EXIT HUP INT TERM
+}
+
+## Stores the path of the file caching the aliases for the location in `$where`
+## in `cache_file`, and a line describing everything else (other than the files
+## they're read from) which they depend on in `cache_context`. Fails if the
+## aliases shouldn't be cached at all.
+cache_entry() {
+  # Configuration from the command line can't be checked for changes.
+  if [ -n "$GIT_DIR$GIT_CONFIG_PARAMETERS$GIT_CONFIG_COUNT" ]; then
+    return 1
+  fi
+
+  cache_context="1|$where|$PWD|$HOME|$XDG_CONFIG_HOME|$GIT_CONFIG_GLOBAL|$GIT_CONFIG_SYSTEM|$GIT_CONFIG_NOSYSTEM"
+
+  # The file's name only needs to be valid (its first line is compared against
+  # `cache_context`), so replacing each slash is enough.
+  cache_name=
+  rest="$where$PWD"
+
+  while true; do
+    case "$rest" in
+      */* ) cache_name="$cache_name${rest%%/*}%"; rest="${rest#*/}";;
+      * ) cache_name="$cache_name$rest"; break;;
+    esac
+  done
+
+  if [ ${#cache_name} -gt 200 ]; then
+    return 1
+  fi
+
+  cache_file="$cache_dir/$cache_name"
+}
+
+## Stores the identity (size, modification time, and inode number) of each of
+## the named files in `identities`, one per line, using a single `stat`
+## process. Files which don't exist are recorded as missing.
+file_identities() {
+  identities=
+
+  for path in "$@"; do
+    shift
+
+    if [ -e "$path" ]; then
+      set -- "$@" "$path"
+    else
+      identities="${identities}missing $path
+"
+    fi
+  done
+
+  if [ $# -gt 0 ]; then
+    # GNU and BSD `stat` need different flags to print the same thing.
+    identities="$identities$(stat -L -c '%s %Y %i %n' -- "$@" 2> /dev/null || stat -L -f '%z %m %i %N' -- "$@")
+" || return 1
+  fi
+}
+
+## Reads the header of a cache file from stdin, succeeding if the aliases which
+## follow it are still up to date.
+##
+## The header is made up of `cache_context`, the identities of the files the
+## aliases were read from (followed by an empty line), and the paths of those
+## files (also followed by an empty line).
+read_cache_header() {
+  IFS= read -r line && [ "$line" = "$cache_context" ] || return 1
+
+  stored_identities=
+
+  while IFS= read -r line && [ -n "$line" ]; do
+    stored_identities="$stored_identities$line
+"
+  done
+
+  set --
+
+  while IFS= read -r line && [ -n "$line" ]; do
+    set -- "$@" "$line"
+  done
+
+  file_identities "$@" && [ "$identities" = "$stored_identities" ]
+}
+
+## Displays aliases from the cache file using the awk program in `cache_program`
+## if it is up to date, setting `cache_hit` if so. The awk program's operands
+## are the parameters.
+display_cached() {
+  {
+    read_cache_header && cache_hit=1 &&
+      awk "BEGIN { $awk_extra_init } $cache_program END { report_missing() }" "$@"
+  } < "$cache_file"
+}
+
+## Reads the aliases for the location in `$where` from Git and stores them in
+## the cache file, along with the identities of the files they came from. (A
+## change made to one of those files while its aliases are being read may go
+## unnoticed until the next one.)
+##
+## An index of the aliases' names (used by `--complete`) is stored alongside
+## it, with the same header followed by the names in sorted order.
+##
+## The aliases may come from files only their owner can read, so this runs in a
+## subshell with a umask which keeps everything it creates just as private.
+update_cache() (
+  umask 077
+
+  if [ ! -d "$cache_dir" ]; then
+    mkdir -p "$cache_dir" || return 1
+  fi
+
+  # Rather than tracking how recently each file was used, simply start afresh
+  # once the cache holds too many of them (two per location).
+  set -- "$cache_dir"/*
+
+  if [ $# -ge 128 ]; then
+    rm -f "$@"
+  fi
+
+  temp_file="$cache_file.$$"
+
+  trap 'rm -f "$temp_file" "$temp_file.new" "$temp_file.names"' EXIT
+  trap 'exit 1' HUP INT TERM
+
+  # Git also reads global configuration files which don't exist yet, should
+  # they be created.
+  if [ -n "$GIT_CONFIG_GLOBAL" ]; then
+    set -- "$GIT_CONFIG_GLOBAL"
+  else
+    set -- "$HOME/.gitconfig" "${XDG_CONFIG_HOME:-$HOME/.config}/git/config"
+  fi
+
+  # The temporary file holds the paths of the files the aliases came from (as
+  # described by `read_cache_header`), followed by the aliases themselves in the
+  # same form as `git config --null --get-regexp`.
   case "$where" in
-    --* ) git config "$where" alias."$name" "$*";;
-    * ) git config --file "$where" alias."$name" "$*";;
+    default )
+      load_awk track-includes.awk parse-config-list.awk glob-patterns.awk select-aliases.awk format-cache.awk
+
+      # Git's output is saved first so that any failure isn't masked by awk.
+      git config --list --show-scope --show-origin --null > "$temp_file.new" || return 1
+
+      # The paths of the repository's own files are relative to the top of its
+      # working tree, which may not be the current directory. (Outside of a
+      # repository, there are no such files.)
+      cdup="$(git rev-parse --show-cdup 2> /dev/null)"
+
+      # Any error is reported when the aliases are read directly instead.
+      {
+        printf '%s\n' "$@"
+        awk "BEGIN { list_sources = 1; source_prefix = \"$cdup\" } $awk_program" < "$temp_file.new" 2> /dev/null
+      } > "$temp_file" || return 1
+    ;;
+
+    * )
+      case "$where" in
+        --global ) ;;
+        --* ) set -- "$(config_file_path)" || return 1;;
+        * ) set -- "$where";;
+      esac
+
+      {
+        printf '%s\n' "$@" ""
+
+        # Git exits with a status of 1 if there are no aliases.
+        case "$where" in
+          --* ) git config "$where" --null --get-regexp '^alias\.';;
+          * ) git config --file "$where" --null --get-regexp '^alias\.';;
+        esac
+
+        [ $? -le 1 ]
+      } > "$temp_file" || return 1
+    ;;
   esac
-else
-  # Alias definition missing; display alias(es) instead.
 
-  # I can't believe there's no *actually* portable way to do this other than to
-  # implement (hack) it yourself. Might not work in all cases.
-  canonicalize_path() {
-    # Keep a copy of the original path for error reporting.
-    original="$1"
+  set --
 
-    previous=
-    current="$1"
+  while IFS= read -r line && [ -n "$line" ]; do
+    set -- "$@" "$line"
+  done < "$temp_file"
 
-    while [ "$previous" != "$current" ]; do
-      previous="$current"
-      dirname="$(dirname "$current")"
-      basename="$(basename "$current")"
+  file_identities "$@" || return 1
 
-      # If basename is ".", we're done. Discard it and "return" just dirname.
-      if [ "$basename" = . ]; then
-        echo "$dirname"
+  {
+    printf '%s\n%s\n' "$cache_context" "$identities"
+    cat "$temp_file"
+  } > "$temp_file.new" && mv -f "$temp_file.new" "$cache_file" || return 1
 
-        return
-      fi
+  load_awk parse-aliases.awk glob-patterns.awk select-aliases.awk format-names.awk
 
-      # If basename is "..", the only way to resolve it is to move it into
-      # dirname.
-      if [ "$basename" = ".." ]; then
-        dirname="$dirname/.."
-        basename="."
-      fi
+  {
+    printf '%s\n%s\n' "$cache_context" "$identities"
+    printf '%s\n' "$@" ""
 
-      cd -- "$dirname" || abort "Couldn't cd to \"$dirname\"."
+    {
+      # Skip over the paths at the start of the temporary file.
+      while IFS= read -r line && [ -n "$line" ]; do
+        :
+      done
 
-      if [ -h "$basename" ]; then
-        current="$(readlink "$basename" || abort "Couldn't resolve \"$dirname/$basename\" while canonicalizing \"$original\".")"
-      else
-        current="$(pwd)/$basename"
-      fi
-    done
+      awk "$awk_program"
+    } < "$temp_file" | LC_ALL=C sort -u
+  } > "$temp_file.names" && mv -f "$temp_file.names" "$cache_file.names" || return 1
+
+  rm -f "$temp_file"
+
+  trap - EXIT HUP INT TERM
+)
+
+## Formats the aliases read from stdin for display, using the awk program in
+## `awk_program` with the parameters as its operands. As this runs alongside the
+## process reading the aliases, it is traced on a separate track (thread).
+format_aliases() {
+  trace_tid=2
+  traced format awk "BEGIN { $awk_extra_init } $awk_program END { report_missing() }" "$@"
+}
+
+## Prints the matching alias names from the cached index if it is up to date,
+## setting `index_hit` if so. Only the header is read by the shell (which reads
+## a byte at a time); the names are all left to a single awk process.
+complete_from_index() {
+  {
+    read_cache_header && index_hit=1 && awk "$complete_program" "$prefix"
+  } < "$cache_file.names"
+}
+
+if [ "$mode" = complete ]; then
+  # Print the names of the aliases which begin with the given prefix, for use
+  # by shell completion.
 
-    echo "$current"
-  }
+  if [ $# -gt 1 ]; then
+    >&2 echo "Usage: git alias --complete [flags] [<prefix>]"
 
-  script_dir="$(dirname "$(canonicalize_path "$0")")"
+    exit 1
+  fi
+
+  if [ "$where" = --effective ]; then
+    >&2 echo "Aliases can't be completed from --effective."
+
+    exit 1
+  fi
+
+  prefix="$1"
+  load_awk complete-names.awk
+  complete_program="$awk_program"
+
+  # The index is used whether or not GIT_ALIAS_CACHE is set, as otherwise this
+  # would be too slow to run on every keypress.
+  if cache_entry; then
+    index_hit=
+
+    if [ -f "$cache_file.names" ]; then
+      complete_from_index
+    fi
+
+    if [ -z "$index_hit" ] && traced update-cache update_cache; then
+      complete_from_index
+    fi
+
+    if [ -n "$index_hit" ]; then
+      exit 0
+    fi
+  fi
+
+  # If the index couldn't be used, fall back to listing the names directly.
+  case "$where" in
+    default ) set --;;
+    --* ) set -- "$where";;
+    * ) set -- --file "$where";;
+  esac
+
+  "$0" "$@" --names-only | LC_ALL=C sort -u | awk "$complete_program" "$prefix"
+elif [ "$mode" = sync ]; then
+  # Make the aliases match those in another file, editing only those which
+  # differ.
+
+  if [ "$format" != default ]; then
+    >&2 echo "Format flags have no meaning when syncing aliases."
+  fi
+
+  if [ $# -gt 0 ] || [ -z "$sync_source" ]; then
+    >&2 echo "Usage: git alias --sync-from <file> [--format shell|config|json] [--dry-run]"
+
+    exit 1
+  fi
+
+  if [ "$where" = --effective ]; then
+    >&2 echo "Aliases can't be synced into --effective."
+
+    exit 1
+  fi
+
+  if [ ! -r "$sync_source" ]; then
+    >&2 echo "Could not read \"$sync_source\"."
+
+    exit 1
+  fi
+
+  # `$parser` may name more than one script, so it is deliberately left unquoted
+  # where it's used.
+  case "$import_format" in
+    shell ) parser="shell-words.awk parse-shell.awk";;
+    config ) parser="parse-gitconfig.awk";;
+    json ) parser="parse-json.awk";;
+    * ) >&2 echo "Invalid import format \"$import_format\"."; exit 1;;
+  esac
+
+  resolve_location
+
+  # The aliases are read from the source file on stdin, exactly as they are
+  # when importing them. The edits are reported on file descriptor 3.
+  if [ -n "$dry_run" ]; then
+    config_file="$(config_file_path)" || exit 1
+
+    # shellcheck disable=2086
+    load_awk $parser sync-aliases.awk rewrite-config.awk
+
+    LC_ALL=C awk "BEGIN { dry_run = 1; report_prefix = \"$dry_run\" } $awk_program" "$config_file" 3>&1 > /dev/null < "$sync_source"
+  else
+    # shellcheck disable=2086
+    rewrite_config_file $parser sync-aliases.awk rewrite-config.awk < "$sync_source"
+    clear_cache
+  fi
+elif [ "$mode" = move ]; then
+  # Move the aliases matching the given patterns (or all of them) from one
+  # location to another.
+
+  if [ "$format" != default ]; then
+    >&2 echo "Format flags have no meaning when moving aliases."
+  fi
+
+  if [ "$where" != default ]; then
+    >&2 echo "Usage: git alias --move [--from <location>] [--to <location>] [<pattern>...]"
+
+    exit 1
+  fi
+
+  if [ "$move_from" = --effective ] || [ "$move_to" = --effective ]; then
+    >&2 echo "Aliases can't be moved into or out of --effective."
+
+    exit 1
+  fi
+
+  # Either location defaults to the configured one, like everywhere else.
+  where="${move_from:-default}"
+  resolve_location
+  from_file="$(config_file_path)" || exit 1
+
+  where="${move_to:-default}"
+  resolve_location
+  to_file="$(config_file_path)" || exit 1
+
+  if [ "$from_file" = "$to_file" ]; then
+    >&2 echo "Aliases can't be moved to the file they're already in (\"$from_file\")."
+
+    exit 1
+  fi
+
+  lock_config_file "$from_file" || exit 1
+  from_lock="$lock_file"
+  moving="$from_lock.moving"
+
+  trap 'rm -f "$from_lock" "$moving" "$moving.all"' EXIT
+  trap 'exit 1' HUP INT TERM
+
+  lock_config_file "$to_file" || exit 1
+  to_lock="$lock_file"
+  backup="$to_lock.backup"
+
+  trap 'rm -f "$from_lock" "$moving" "$moving.all" "$to_lock" "$backup"' EXIT
+
+  # The aliases to move are read just once, in the same form as `git config
+  # --null --get-regexp`, and then fed to both rewrites. Git exits with a status
+  # of 1 if there are no aliases.
+  traced read-config git config --file "$from_file" --null --get-regexp '^alias\.' > "$moving.all"
+  [ $? -le 1 ] || exit 1
+
+  awk_extra_init=
+
+  if [ $# -gt 0 ]; then
+    awk_extra_init="matching=1;"
+  fi
+
+  load_awk parse-aliases.awk glob-patterns.awk select-aliases.awk format-cache.awk
+  awk "BEGIN { $awk_extra_init } $awk_program" "$@" < "$moving.all" > "$moving" || exit 1
+
+  if [ ! -s "$moving" ]; then
+    >&2 echo "No aliases to move were found."
+
+    exit 1
+  fi
+
+  # Both new files are written before either one replaces the original, so
+  # that nothing has changed if anything goes wrong up to that point. (The file
+  # path is taken by rewrite-config.awk before select-aliases.awk looks for
+  # operands.)
+  load_awk parse-aliases.awk rewrite-config.awk glob-patterns.awk select-aliases.awk
+
+  traced rewrite awk "$awk_program" "$to_file" < "$moving" > "$to_lock" || exit 1
+  traced rewrite awk "BEGIN { unsetting = 1 } $awk_program" "$from_file" < "$moving" > "$from_lock" || exit 1
+
+  # Keep the destination's original contents until the source has been replaced
+  # as well, so that the move can be undone if that fails. A hard link avoids
+  # copying the file where possible.
+  backed_up=
+
+  if [ -e "$to_file" ]; then
+    ln -f "$to_file" "$backup" 2> /dev/null || cp -p "$to_file" "$backup" || exit 1
+    backed_up=1
+  fi
+
+  mv -f "$to_lock" "$to_file" || exit 1
+
+  if ! mv -f "$from_lock" "$from_file"; then
+    if [ -n "$backed_up" ]; then
+      mv -f "$backup" "$to_file"
+    else
+      rm -f "$to_file"
+    fi
+
+    >&2 echo "Could not rewrite config file \"$from_file\", so no aliases were moved."
+
+    exit 1
+  fi
+
+  # Both lock files have replaced the files they locked, so they're no longer
+  # ours to remove (another process may have taken either lock since).
+  trap 'rm -f "$moving" "$moving.all" "$backup"' EXIT
+
+  clear_cache
+elif [ "$mode" = batch ]; then
+  # Apply all the edits read from stdin at once.
+
+  if [ "$format" != default ]; then
+    >&2 echo "Format flags have no meaning when editing aliases."
+  fi
+
+  if [ $# -gt 0 ]; then
+    >&2 echo "Usage: git alias --batch < <file>"
+
+    exit 1
+  fi
+
+  if [ "$where" = --effective ]; then
+    >&2 echo "Aliases can't be edited in --effective."
+
+    exit 1
+  fi
+
+  resolve_location
+
+  # As when importing, the edits are read from stdin and the configuration file
+  # is only locked (and rewritten) once, however many of them there are.
+  rewrite_config_file shell-words.awk glob-patterns.awk parse-batch.awk rewrite-config.awk
+  clear_cache
+elif [ "$mode" = import ]; then
+  # Define all the aliases read from stdin.
+
+  if [ "$format" != default ]; then
+    >&2 echo "Format flags have no meaning when importing aliases."
+  fi
+
+  if [ $# -gt 0 ]; then
+    >&2 echo "Usage: git alias --import [--format shell|config|json]"
+
+    exit 1
+  fi
+
+  if [ "$where" = --effective ]; then
+    >&2 echo "Aliases can't be imported into --effective."
+
+    exit 1
+  fi
+
+  # `$parser` may name more than one script, so it is deliberately left unquoted
+  # where it's used.
+  case "$import_format" in
+    shell ) parser="shell-words.awk parse-shell.awk";;
+    config ) parser="parse-gitconfig.awk";;
+    json ) parser="parse-json.awk";;
+    * ) >&2 echo "Invalid import format \"$import_format\"."; exit 1;;
+  esac
+
+  resolve_location
+
+  # The awk scripts read the path of the configuration file from their first
+  # operand, leaving stdin free for the aliases being imported.
+  # shellcheck disable=2086
+  rewrite_config_file $parser rewrite-config.awk
+  clear_cache
+elif [ "$mode" = default ] && [ $# -gt 1 ]; then
+  # Define an alias.
+
+  if [ "$format" != default ]; then
+    >&2 echo "Format flags have no meaning when creating an alias."
+  fi
+
+  if [ "$where" = --effective ]; then
+    >&2 echo "Aliases can't be defined in --effective."
+
+    exit 1
+  fi
+
+  resolve_location
+
+  name="$1"
+  shift
+
+  # Using "$*" here allows commands like `git alias cdiff diff --cached` to work
+  # as expected by combining all the arguments after the alias name into a
+  # single string.
+  case "$where" in
+    --* ) traced define git config "$where" alias."$name" "$*";;
+    * ) traced define git config --file "$where" alias."$name" "$*";;
+  esac && clear_cache
+else
+  # Alias definition missing; display alias(es) instead.
 
   # Extra variables needed by the awk scripts are set via a BEGIN block on the
   # command line rather than via command-line arguments because it's awkward at
@@ -112,46 +646,105 @@ else
       formatter="format-gitconfig.awk"
 
       if [ "$format" = --config ]; then
-        awk_extra_init="${awk_extra_init}print \"[alias]\";indent=\"\\t\";"
+        awk_extra_init="${awk_extra_init}header=\"[alias]\";indent=\"\\t\";"
       fi
     ;;
 
-    --json | --json-compact )
+    --json | --json-compact | --ndjson )
       formatter="format-json.awk"
 
       if [ "$format" = --json-compact ]; then
         awk_extra_init="${awk_extra_init}style=\"compact\";"
+      elif [ "$format" = --ndjson ]; then
+        awk_extra_init="${awk_extra_init}style=\"ndjson\";"
       else
         awk_extra_init="${awk_extra_init}style=\"pretty\";"
       fi
     ;;
 
     --names-only ) formatter="format-names.awk";;
+    --null ) formatter="format-null.awk";;
 
     * ) >&2 echo "Invalid format \"$format\". How did you do that?"; exit 1;;
   esac
 
-  if [ $# -gt 0 ]; then
-    # Display only the named alias.
+  if [ "$mode" = match ]; then
+    if [ $# -eq 0 ]; then
+      >&2 echo "Usage: git alias --match [flags] <pattern>..."
 
-    case "$where" in
-      --* ) aliases="$(git config "$where" --get-regexp "^alias\\.$1\$")";;
-      * ) aliases="$(git config --file "$where" --get-regexp "^alias\\.$1\$")";;
-    esac
+      exit 1
+    fi
 
-    if [ -z "$aliases" ]; then
-      >&2 echo "No alias named \"$1\" exists."
+    awk_extra_init="${awk_extra_init}matching=1;"
+  fi
 
-      exit 1
+  # The names of the aliases to display (if any) are passed to awk as operands,
+  # which are removed before any input is read. Every alias is read and the
+  # names are compared exactly in awk, so that any number of them can be looked
+  # up at once without building a regular expression out of them. Any which
+  # don't exist are reported after the rest have been displayed. With
+  # `--match`, the operands are patterns instead, which are also matched in awk
+  # so that only the matching aliases are formatted.
+  if [ -n "$GIT_ALIAS_CACHE" ] && [ "$where" != --effective ] && [ -z "$includes" ] && cache_entry; then
+    # Display the aliases from the cache, updating it first if any of the files
+    # they came from have changed. When it's up to date, Git isn't run at all.
+    load_awk parse-aliases.awk glob-patterns.awk select-aliases.awk "$formatter"
+    cache_program="$awk_program"
+    cache_hit=
+
+    if [ -f "$cache_file" ]; then
+      traced display-cached display_cached "$@"
+      status=$?
+    fi
+
+    if [ -z "$cache_hit" ] && traced update-cache update_cache; then
+      traced display-cached display_cached "$@"
+      status=$?
+    fi
+
+    # If the cache couldn't be used, fall back to reading the aliases directly.
+    if [ -n "$cache_hit" ]; then
+      exit $status
     fi
+  fi
+
+  if [ "$where" = --effective ]; then
+    # Display the definitions which take effect, whichever location they come
+    # from, along with any they shadow. This only needs a single Git process,
+    # too.
+    load_awk track-includes.awk parse-effective.awk glob-patterns.awk select-aliases.awk "$formatter"
+
+    traced read-config git config --list --show-scope --show-origin --null |
+      format_aliases "$@"
+  elif [ -n "$includes" ]; then
+    # Display the aliases from the location and every file it includes, each
+    # along with the file it came from, the same way as with --effective. Git
+    # reads all of the files in a single process, and awk skips over any repeat
+    # copies of files which are included more than once.
+    resolve_location
+    load_awk track-includes.awk parse-effective.awk glob-patterns.awk select-aliases.awk "$formatter"
+
+    case "$where" in
+      --* ) traced read-config git config "$where" --includes --list --show-scope --show-origin --null;;
+      * ) traced read-config git config --file "$where" --includes --list --show-scope --show-origin --null;;
+    esac | format_aliases "$@"
+  elif [ "$where" = default ]; then
+    # Display aliases from the configured location. Rather than asking Git for
+    # the setting first, read it along with all the aliases (in every location)
+    # and let awk pick out the right ones, so that only one Git process is
+    # needed.
+    load_awk track-includes.awk parse-config-list.awk glob-patterns.awk select-aliases.awk "$formatter"
+
+    traced read-config git config --list --show-scope --show-origin --null |
+      format_aliases "$@"
   else
-    # Alias name missing; display all aliases.
+    load_awk parse-aliases.awk glob-patterns.awk select-aliases.awk "$formatter"
 
+    # Git's output is piped straight into awk (shell variables can't hold the
+    # NUL characters separating its records).
     case "$where" in
-      --* ) aliases="$(git config "$where" --get-regexp ^alias\\.)";;
-      * ) aliases="$(git config --file "$where" --get-regexp ^alias\\.)";;
-    esac
+      --* ) traced read-config git config "$where" --null --get-regexp '^alias\.';;
+      * ) traced read-config git config --file "$where" --null --get-regexp '^alias\.';;
+    esac | format_aliases "$@"
   fi
-
-  echo "$aliases" | awk "BEGIN { $awk_extra_init } $(cat "$script_dir/parse-aliases.awk") $(cat "$script_dir/$formatter")"
 fi
@@ -1,5 +1,6 @@
 #!/bin/sh
 
+cache_dir="${XDG_CACHE_HOME:-$HOME/.cache}/git-alias"
 dry_run=
 where=default
 
@@ -8,6 +9,7 @@ while true; do
     --dry-run ) dry_run="[dry-run] ";;
     --file ) where="$2"; shift;;
     --global | --local | --system | --worktree ) where=$1;;
+    --all-scopes ) where=all-scopes;;
     -- ) shift; break;;
     *) break;;
   esac
@@ -15,102 +17,239 @@ while true; do
   shift
 done
 
+trace_category=git-unalias
+
+## Loads the helpers shared with git-alias from git-alias-common.sh, which is
+## kept alongside the awk scripts in the directory containing this script. That
+## directory is stored in `script_dir`, following any symlinks to this script
+## the same way as `resolve_symlinks` (which can't be used until the helpers are
+## loaded). Setting GIT_ALIAS_HOME to the directory skips resolving it from
+## `$0`.
+##
+## The bundled version of this script (see the Makefile) replaces this function
+## with the helpers themselves.
+load_common() {
+  script_dir="$GIT_ALIAS_HOME"
+
+  if [ -z "$script_dir" ]; then
+    # Giving the path a directory means there's always one to take off of it.
+    case "$0" in
+      */* ) script_path="$0";;
+      * ) script_path="./$0";;
+    esac
+
+    links_left=40
+
+    while [ -h "$script_path" ]; do
+      links_left=$((links_left - 1))
+
+      if [ "$links_left" -eq 0 ]; then
+        >&2 echo "Too many levels of symbolic links while resolving \"$0\"."
+
+        exit 1
+      fi
+
+      link_target="$(readlink "$script_path")" || exit 1
+
+      case "$link_target" in
+        /* ) script_path="$link_target";;
+        * ) script_path="${script_path%/*}/$link_target";;
+      esac
+    done
+
+    script_dir="${script_path%/*}"
+  fi
+
+  . "$script_dir/git-alias-common.sh"
+}
+
+load_common
+
+## Removes the aliases named on stdin (one per line) from the configuration file
+## used by the location in `$where` in a single step, under the same lock Git
+## itself uses. Either all of them are removed or (if anything goes wrong) none
+## are.
+remove_aliases() {
+  config_file="$(config_file_path)" || return 1
+
+  lock_config_file "$config_file" || return 1
+
+  trap 'rm -f "$lock_file"' EXIT
+  trap 'exit 1' HUP INT TERM
+
+  load_awk unset-aliases.awk rewrite-config.awk
+
+  # Once the lock file has replaced the configuration file, it's no longer ours
+  # to remove (another process may have taken the lock since).
+  if traced rewrite awk "$awk_program" "$config_file" > "$lock_file" &&
+    mv -f "$lock_file" "$config_file"; then
+    trap - EXIT HUP INT TERM
+
+    return 0
+  fi
+
+  rm -f "$lock_file"
+  trap - EXIT HUP INT TERM
+
+  return 1
+}
+
+## Removes the single alias named in `matched` from the location in `$where`.
+## Git takes care of locking and rewriting the file itself, so this only needs
+## a single process.
+remove_alias() {
+  case "$where" in
+    --* ) traced unset git config "$where" --unset-all "alias.$matched";;
+    * ) traced unset git config --file "$where" --unset-all "alias.$matched";;
+  esac
+}
+
+## Removes every `[alias]` section from the configuration file used by the
+## location in `$where` (including any left empty by earlier removals), using a
+## single Git process. This is only correct once every alias has matched.
+##
+## Git only removes the sections whose header is spelled exactly `[alias]`, so
+## if any other header may hold aliases (such as `[Alias]`, which Git reads the
+## same way, or `[alias "name"]`), they're removed by `remove_aliases` instead.
+remove_alias_sections() {
+  config_file="$(config_file_path)" || return 1
+
+  if grep -i -E '^[[:space:]]*\[[[:space:]]*alias([^[:alnum:]-]|$)' "$config_file" |
+    grep -q -v '^[[:space:]]*\[alias\]'; then
+    remove_aliases
+  else
+    traced remove-section git config --file "$config_file" --remove-section alias
+  fi
+}
+
 if [ $# -eq 0 ]; then
   >&2 echo "Usage: git unalias [flags] <pattern>..."
 
   exit 1
 fi
 
-# Convert the default file location into a valid command-line flag for Git. If a
-# flag or custom file is configured, use that. Otherwise, fall back to the
-# global file.
-if [ "$where" = default ]; then
-  configured_location="$(git config --get git-alias.config-file)"
-
-  case "$configured_location" in
-    "" ) where=--global;;
-    --global | --local | --system | --worktree ) where="$configured_location";;
-    "--file "* ) where="$(echo "$configured_location" | cut -c 8-)";;
-    * ) where="$configured_location";;
-  esac
-fi
+resolve_location
 
 # This variable controls the script's exit code.
 status=
 
-## Unset any aliases which match the provided pattern.
-##
-## The parameter is the pattern to match against.
-##
-## Alias names are read from the global `name` variable and any which were not
-## unset are stored back to it.
+# Every alias is matched against all of the patterns by a single awk process,
+# rather than looping over the names in the shell once per pattern, which also
+# runs Git to list them. It prints how many of the aliases didn't match anything
+# (if that's known), followed by the names of those which did, assigning each
+# alias to the first pattern it matches so that it's only unset once. (Names are
+# only listed once, even if an alias is defined more than once.) With
+# `--all-scopes`, every scope is read by a single Git process and the matches
+# are grouped by the file they came from instead.
+trace_begin match
+load_awk glob-patterns.awk match-aliases.awk
+matches="$(awk "BEGIN { report_prefix = \"$dry_run\" } $awk_program" "$where" "$@")" || status=1
+trace_end
+
+## Prints a line for each alias named in `matched` (one per line), in the form
+## `'unset <name>'` (prefixed with `$dry_run`, if set, and followed by
+## `$report_suffix`).
+report_matched() {
+  printf '%s\n' "$matched" | while IFS= read -r name; do
+    echo "${dry_run}'unset $name'$report_suffix"
+  done
+}
+
+## Unsets the aliases named in `matched` (one per line) from the location in
+## `$where`, then reports them (or, with `--dry-run`, only reports them).
+## `$unmatched_count` must be the number of aliases in that location which
+## didn't match, or `?` if that isn't known.
 ##
-## If a pattern fails to match any remaining aliases, an error is printed and
-## the script's exit code is set to 1.
-unset_matching_aliases() {
-  found=
-  remaining=
-  pattern="$1"
-
-  # `$names` is deliberately unquoted so that its words (the names of the
-  # aliases) can be spread into positional parameters.
-  #
-  # shellcheck disable=2086
-  set -- $names
-
-  while [ $# -gt 0 ]; do
-    # `$pattern` is deliberately unquoted so that it can act as a pattern.
-    #
-    # shellcheck disable=2254
-    case "$1" in
-      $pattern )
-        if [ -n "$dry_run" ] || (
-          case "$where" in
-            --* ) git config "$where" --unset alias."$1";;
-            * ) git config --file "$where" --unset alias."$1";;
-          esac
-        ); then
-          echo "${dry_run}'unset $1'"
-
-          found=1
-        else
-          >&2 echo "Failed to unset alias $1, which matched pattern '$pattern'."
-
-          # Assume that a non-zero status from Git means the alias still
-          # exists.
-          remaining="$remaining $1"
-        fi
-      ;;
+## If they can't be unset, `$failure_message` is printed and the script's exit
+## code is set to 1.
+unset_matched() {
+  if [ -n "$dry_run" ]; then
+    report_matched
 
-      * ) remaining="$remaining $1";;
-    esac
+    return
+  fi
 
-    shift
-  done
+  # Every matching alias is removed by a single rewrite of the configuration
+  # file, rather than running Git (which rewrites the whole file) once for each
+  # of them. As the new file replaces the old one in one step, the aliases are
+  # never left partly removed. A single alias is simply left to Git, and if
+  # none are left over, Git can drop the whole section instead.
+  case "$matched" in
+    *"$newline"* )
+      if [ "$unmatched_count" = 0 ]; then
+        remove=remove_alias_sections
+      else
+        remove=remove_aliases
+      fi
+    ;;
+
+    * ) remove=remove_alias;;
+  esac
 
-  if [ -z "$found" ]; then
-    >&2 echo "${dry_run}No aliases matching \"$pattern\" were found."
+  if printf '%s\n' "$matched" | $remove; then
+    report_matched
+  else
+    >&2 echo "$failure_message"
 
     status=1
   fi
-
-  names="$remaining"
 }
 
-# This variable stores the names of aliases which have been discovered, but not
-# yet unset. It is updated by `unset_matching_aliases` to remove the names of
-# any aliases which were unset. This allows us to prevent trying to unset the
-# same alias multiple times if it matches multiple patterns without having to
-# re-query `git config` after every iteration.
-case "$where" in
-  --* ) names="$(git config "$where" --name-only --get-regexp ^alias\\. | cut -d . -f 2)";;
-  * ) names="$(git config --file "$where" --name-only --get-regexp ^alias\\. | cut -d . -f 2)";;
-esac
+newline="
+"
+tab="	"
+
+if [ "$where" = all-scopes ]; then
+  # Git reports the paths of the repository's own files relative to the top of
+  # its working tree, which isn't necessarily the current directory.
+  cdup=
+  cdup_known=
+
+  while IFS="$tab" read -r scope unmatched_count names path; do
+    [ -n "$path" ] || continue
+
+    case "$path" in
+      /* ) ;;
+      * )
+        if [ -z "$cdup_known" ]; then
+          cdup="$(git rev-parse --show-cdup)"
+          cdup_known=1
+        fi
 
-while [ $# -gt 0 ]; do
-  unset_matching_aliases "$1"
+        path="$cdup$path"
+      ;;
+    esac
 
-  shift
-done
+    # `$names` is deliberately unquoted so that its words (the names of the
+    # aliases) are printed on separate lines.
+    #
+    # shellcheck disable=2086
+    matched="$(printf '%s\n' $names)"
+    where="$path"
+    report_suffix=" ($scope: $path)"
+    failure_message="Failed to unset the aliases which matched in \"$path\", so none were unset from it."
+
+    unset_matched
+  done <<EOF
+$matches
+EOF
+else
+  unmatched_count="${matches%%"$newline"*}"
+
+  case "$matches" in
+    *"$newline"* ) matched="${matches#*"$newline"}";;
+    * ) matched=;;
+  esac
+
+  report_suffix=
+  failure_message="Failed to unset the aliases which matched, so none were unset."
+
+  [ -z "$matched" ] || unset_matched
+fi
+
+# Any aliases cached by `git alias` may no longer be accurate.
+if [ -z "$dry_run" ]; then
+  clear_cache
+fi
 
 exit $status
@@ -0,0 +1,163 @@
+# Provides `glob_to_regex`, for matching alias names against the same kind of
+# patterns as a shell's `case` statement.
+
+## Converts a `case`-style pattern (supporting `*`, `?`, bracket expressions,
+## and backslash escapes) into an equivalent regular expression which matches
+## the whole of a string.
+function glob_to_regex(pattern,    regex, char, end, count, i) {
+  regex = ""
+  count = length(pattern)
+
+  for (i = 1; i <= count; i++) {
+    char = substr(pattern, i, 1)
+
+    if (char == "*") {
+      regex = regex ".*"
+    } else if (char == "?") {
+      regex = regex "."
+    } else if (char == "\\" && i < count) {
+      regex = regex quote_regex_char(substr(pattern, ++i, 1))
+    } else if (char == "[" && (end = bracket_end(pattern, i))) {
+      regex = regex bracket_to_regex(substr(pattern, i + 1, end - i - 1))
+      i = end
+    } else {
+      regex = regex quote_regex_char(char)
+    }
+  }
+
+  return "^(" regex ")$"
+}
+
+## Returns the position of the `]` which closes the bracket expression starting
+## at position `start` of `pattern`, or 0 if it isn't closed (in which case the
+## `[` is an ordinary character). Character classes (such as `[:alpha:]`),
+## equivalence classes, and collating symbols within it are skipped over, as
+## they end with a `]` of their own.
+function bracket_end(pattern, start,    i, delimiter, end) {
+  i = start + 1
+
+  if (substr(pattern, i, 1) == "!" || substr(pattern, i, 1) == "^") {
+    i++
+  }
+
+  # A `]` immediately following the `[` (or its negation) is part of the set.
+  if (substr(pattern, i, 1) == "]") {
+    i++
+  }
+
+  for (; i <= length(pattern); i++) {
+    if (substr(pattern, i, 1) == "]") {
+      return i
+    }
+
+    delimiter = substr(pattern, i + 1, 1)
+
+    if (substr(pattern, i, 1) == "[" && delimiter != "" && index(":=.", delimiter)) {
+      end = index(substr(pattern, i + 2), delimiter "]")
+
+      # Skip to the class's closing `]`.
+      if (end) {
+        i += end + 2
+      }
+    }
+  }
+
+  return 0
+}
+
+## Converts the contents of a bracket expression into a regular expression.
+## Character classes are kept as they are, while equivalence classes and
+## collating symbols (which awk doesn't support) are replaced by the characters
+## they name, as they stand for nothing else in the C locale.
+function bracket_to_regex(set,    regex, char, delimiter, end, name, i) {
+  regex = ""
+  i = 1
+
+  if (substr(set, 1, 1) == "!" || substr(set, 1, 1) == "^") {
+    regex = "^"
+    i = 2
+  }
+
+  for (; i <= length(set); i++) {
+    char = substr(set, i, 1)
+    delimiter = substr(set, i + 1, 1)
+    end = 0
+
+    if (char == "[" && delimiter != "" && index(":=.", delimiter)) {
+      end = index(substr(set, i + 2), delimiter "]")
+    }
+
+    if (!end) {
+      regex = regex quote_bracket_chars(char, 0)
+
+      continue
+    }
+
+    name = substr(set, i + 2, end - 1)
+    i += end + 2
+
+    if (delimiter != ":") {
+      regex = regex quote_bracket_chars(name, 1)
+    } else if (name ~ /^(alnum|alpha|blank|cntrl|digit|graph|lower|print|punct|space|upper|xdigit)$/) {
+      regex = regex "[:" name ":]"
+    }
+  }
+
+  # Unknown character classes match nothing, which may leave nothing at all.
+  if (regex == "") {
+    return "[^\001-\377]"
+  } else if (regex == "^") {
+    return "."
+  }
+
+  return "[" regex "]"
+}
+
+## Escapes the characters which would have a special meaning in awk's bracket
+## expressions (but not a shell's). If `literal` is set, the characters which
+## have a special meaning in both are escaped too.
+function quote_bracket_chars(chars, literal) {
+  # Backslashes are literal in bracket expressions, but not in awk's.
+  if (literal) {
+    gsub(/[]\\[^-]/, "\\\\&", chars)
+  } else {
+    gsub(/[\\[]/, "\\\\&", chars)
+  }
+
+  return chars
+}
+
+## Escapes a single character if it would have a special meaning in a regular
+## expression.
+function quote_regex_char(char) {
+  if (index("\\.[]()*+?{}|^$", char)) {
+    return "\\" char
+  }
+
+  return char
+}
+
+## Returns a regular expression (in the extended syntax Git's `--get-regexp`
+## uses) which matches every string beginning with the literal characters that
+## start a `case`-style pattern. If the whole pattern is literal, the expression
+## is anchored at the end too, so that it only matches that exact string.
+function glob_prefix_regex(pattern,    regex, char, count, i) {
+  regex = ""
+  count = length(pattern)
+
+  for (i = 1; i <= count; i++) {
+    char = substr(pattern, i, 1)
+
+    if (char == "*" || char == "?" || (char == "[" && bracket_end(pattern, i))) {
+      return regex
+    }
+
+    if (char == "\\" && i < count) {
+      char = substr(pattern, ++i, 1)
+    }
+
+    regex = regex quote_regex_char(char)
+  }
+
+  return regex "$"
+}
@@ -0,0 +1,210 @@
+# Decides which aliases `git unalias` removes, in a single pass. The first
+# operand is the location to remove them from (a flag such as `--global`, the
+# path of a file, or `all-scopes`), and the rest are `case`-style patterns (see
+# glob-patterns.awk, which must also be included). The names of the existing
+# aliases are read by running `git config --name-only --get-regexp` on that
+# location, and each one is assigned to the first pattern it matches, so that
+# it's only removed once, however many of them match it.
+#
+# Git is only asked for the aliases which could match, using an expression
+# built from the literal text at the start of each pattern, so that it doesn't
+# have to list every alias just to find a few. That expression only matches all
+# of them if at least one pattern begins with a wildcard.
+#
+# The number of aliases which didn't match any pattern is printed first (or `?`
+# if Git only listed those which could match, so it isn't known), followed by
+# the names of those which did (one per line), grouped by pattern in the order
+# the patterns were given. Each pattern which didn't match anything is reported
+# on stderr (prefixed with `report_prefix`), and the script then exits with a
+# status of 1, as it does if Git fails.
+#
+# With `all-scopes`, every scope is read by a single Git process and the aliases
+# are matched separately for each file they're defined in. Each file with
+# matching aliases is then printed on a line of its own, as its scope, the
+# number of its aliases which didn't match (or `?`), and the names of those
+# which did (separated by spaces), followed by its path, all separated by tabs.
+# Aliases which weren't defined in a file (such as those given on Git's command
+# line) can't be removed, so are ignored.
+#
+# Aliases in subsections (such as `[alias "name"]`, which Git reports with a dot
+# in their names) can't be removed by rewrite-config.awk, so are never matched.
+
+BEGIN {
+  location = ARGV[1]
+  delete ARGV[1]
+
+  scoped = location == "all-scopes"
+
+  for (i = 2; i < ARGC; i++) {
+    pattern_texts[i - 1] = ARGV[i]
+    patterns[i - 1] = glob_to_regex(ARGV[i])
+    delete ARGV[i]
+  }
+
+  pattern_count = ARGC - 2
+  file_count = 0
+
+  key_regex = key_regex_for_patterns()
+  listed_all = key_regex == "^alias\\."
+
+  if (scoped) {
+    RS = "\0"
+    command = "git config --name-only --show-scope --show-origin --null"
+  } else if (substr(location, 1, 2) == "--") {
+    command = "git config " location " --name-only"
+  } else {
+    command = "git config --file " shell_quote(location) " --name-only"
+  }
+
+  command = command " --get-regexp " shell_quote(key_regex)
+
+  while ((command | getline) > 0) {
+    read_record()
+  }
+
+  # Git exits with a status of 1 if there are no aliases, but anything else
+  # means it has already reported an error.
+  if (close(command) > 1) {
+    status = 1
+  }
+
+  # Everything has been read, so there's no input left to wait for.
+  exit
+}
+
+## Turn any string into a shell-style single-quoted string.
+function shell_quote(string) {
+  gsub(/'/, "'\\''", string)
+
+  return "'" string "'"
+}
+
+## Returns a regular expression for `git config --get-regexp` which only
+## matches the keys of aliases that could match one of the patterns. If any
+## pattern could match every alias, the expression matches them all.
+function key_regex_for_patterns(    regex, prefix, i) {
+  regex = ""
+
+  for (i = 1; i <= pattern_count; i++) {
+    prefix = glob_prefix_regex(pattern_texts[i])
+
+    if (prefix == "") {
+      return "^alias\\."
+    }
+
+    regex = regex (regex == "" ? "" : "|") prefix
+  }
+
+  return "^alias\\.(" regex ")"
+}
+
+## Handles a single record of Git's output.
+function read_record() {
+  if (!scoped) {
+    assign("", substr($0, length("alias.") + 1))
+
+    return
+  }
+
+  # Each alias is described by three records: its scope, its origin, and its
+  # key.
+  field = (++record_count - 1) % 3
+
+  if (field == 0) {
+    scope = $0
+  } else if (field == 1) {
+    origin = $0
+  } else if (substr(origin, 1, 5) == "file:") {
+    file = substr(origin, 6)
+
+    if (!(file in file_scopes)) {
+      file_scopes[file] = scope
+    }
+
+    assign(file, substr($0, length("alias.") + 1))
+  }
+}
+
+## Assigns the named alias from the given file to the first pattern it matches.
+## Aliases defined more than once in the same file are only assigned once.
+function assign(file, name,    i) {
+  if ((file, name) in seen) {
+    return
+  }
+
+  seen[file, name] = 1
+
+  if (!(file in unmatched_count)) {
+    file_order[++file_count] = file
+    unmatched_count[file] = 0
+  }
+
+  # Aliases in subsections are never matched (see above).
+  if (index(name, ".")) {
+    unmatched_count[file]++
+
+    return
+  }
+
+  for (i = 1; i <= pattern_count; i++) {
+    if (name ~ patterns[i]) {
+      # Each match is stored separately (rather than appended to a string),
+      # so that collecting them takes time in proportion to their number.
+      matches[file, i, ++file_match_count[file, i]] = name
+      match_count[i]++
+      file_matched[file] = 1
+
+      return
+    }
+  }
+
+  unmatched_count[file]++
+}
+
+## Returns the number of aliases in the given file which didn't match, or `?`
+## if that isn't known.
+function unmatched(file) {
+  return listed_all ? unmatched_count[file] + 0 : "?"
+}
+
+END {
+  if (!scoped) {
+    print unmatched("")
+
+    for (i = 1; i <= pattern_count; i++) {
+      for (m = 1; m <= file_match_count["", i]; m++) {
+        print matches["", i, m]
+      }
+    }
+  }
+
+  for (f = 1; scoped && f <= file_count; f++) {
+    file = file_order[f]
+
+    if (!(file in file_matched)) {
+      continue
+    }
+
+    printf "%s\t%s\t", file_scopes[file], unmatched(file)
+    separator = ""
+
+    for (i = 1; i <= pattern_count; i++) {
+      for (m = 1; m <= file_match_count[file, i]; m++) {
+        printf "%s%s", separator, matches[file, i, m]
+        separator = " "
+      }
+    }
+
+    printf "\t%s\n", file
+  }
+
+  for (i = 1; i <= pattern_count; i++) {
+    if (!match_count[i]) {
+      print report_prefix "No aliases matching \"" pattern_texts[i] "\" were found." > "/dev/stderr"
+
+      status = 1
+    }
+  }
+
+  exit status
+}
@@ -1,30 +1,27 @@
-# Finds all alias definitions in the output of `git config --get-regexp
+# Finds all alias definitions in the output of `git config --null --get-regexp
 # ^alias\\.` and calls a function named `handle` (which must be provided by a
-# separate script) with the name and body of each one. Multiline aliases are
-# supported.
+# separate script) with the name and body of each one.
+#
+# Each NUL-terminated record holds a single alias, whose key is separated from
+# its body by the first newline (keys can't contain newlines, but bodies can).
+# This means bodies never need to be reassembled from multiple lines and are
+# never mistaken for the start of another alias, whatever they contain.
+#
+# Aliases are passed to `handle` via `handle_if_wanted`, which is provided by
+# select-aliases.awk.
 
-/alias\./ {
-  if (name != "") {
-    handle(name, body)
-  }
-
-  name = $1
-  body = $0
-
-  # When passing a string as the first argument to `sub`, it is interpreted as a
-  # regular expression. Rather than trying to quote the dot always present in
-  # `$1`, it is first removed from `name` and then an already-escaped string is
-  # concatenated back in when removing the configuration name from `body`.
-  sub("alias\\.", "", name)
-  sub("alias\\." name " ", "", body)
+BEGIN {
+  RS = "\0"
 }
 
-!/alias\./ {
-  body = body "\n" $0
-}
+{
+  newline = index($0, "\n")
 
-END {
-  if (name != "") {
-    handle(name, body)
+  # Keys without a value aren't followed by a newline. In either case, the
+  # first six characters of the key are always "alias.".
+  if (newline) {
+    handle_if_wanted(substr($0, 7, newline - 7), substr($0, newline + 1))
+  } else {
+    handle_if_wanted(substr($0, 7), "")
   }
 }
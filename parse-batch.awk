@@ -0,0 +1,86 @@
+# Reads a batch of edits, one per line, of the form `set <name> <body>...` or
+# `unset <pattern>...`, and passes them on to rewrite-config.awk (which must
+# follow this script) so that all of them are applied in a single rewrite. As
+# when invoking `git alias` and `git unalias` directly, multiple body words are
+# joined by spaces and each pattern removes every alias whose name matches it.
+#
+# Words are split the same way the shell would (see shell-words.awk, which must
+# also be included, as must glob-patterns.awk). Blank lines and comments are
+# ignored.
+#
+# The edits are applied in order once the whole batch has been read, so that a
+# pattern only removes aliases which exist at that point (whether they were in
+# the configuration file or set earlier in the batch). If any line can't be
+# understood, or any pattern doesn't match an alias, nothing is rewritten.
+
+{
+  if (!split_words($0)) {
+    next
+  }
+
+  if (word_count > 0) {
+    if (words[1] == "set" && word_count >= 3 && words[2] !~ /^-/) {
+      body = words[3]
+
+      for (i = 4; i <= word_count; i++) {
+        body = body " " words[i]
+      }
+
+      operations[++operation_count] = "set"
+      operation_names[operation_count] = words[2]
+      operation_bodies[operation_count] = body
+    } else if (words[1] == "unset" && word_count >= 2) {
+      for (i = 2; i <= word_count; i++) {
+        operations[++operation_count] = "unset"
+        operation_names[operation_count] = words[i]
+      }
+    } else {
+      fail("Line " NR " is not a `set <name> <body>` or `unset <pattern>` command.")
+    }
+  }
+
+  word_count = 0
+}
+
+END {
+  if (failed) {
+    exit 1
+  }
+
+  if (state != "") {
+    fail("Unterminated quoted string at end of input.")
+  }
+
+  # Find the aliases which already exist (as lowercase names, the same way Git
+  # lists them), so that patterns can be matched against them.
+  scan_config_file()
+
+  for (key in existing) {
+    present[key] = 1
+  }
+
+  for (i = 1; i <= operation_count; i++) {
+    if (operations[i] == "set") {
+      handle(operation_names[i], operation_bodies[i])
+      present[tolower(operation_names[i])] = 1
+
+      continue
+    }
+
+    regex = glob_to_regex(operation_names[i])
+    matched = 0
+
+    for (key in present) {
+      if (key ~ regex) {
+        unset_alias(key)
+        delete present[key]
+
+        matched = 1
+      }
+    }
+
+    if (!matched) {
+      fail("No aliases matching \"" operation_names[i] "\" were found.")
+    }
+  }
+}
@@ -0,0 +1,178 @@
+# Finds all alias definitions in the output of `git config --list --show-scope
+# --show-origin --null` which belong to the location named by the
+# `git-alias.config-file` setting (or the global configuration, if it isn't
+# set) and calls a function named `handle` (which must be provided by a
+# separate script) with the name and body of each one, via `handle_if_wanted`
+# (which is provided by select-aliases.awk).
+#
+# This allows both the setting and the aliases to be read by a single Git
+# process. The exception is when the setting names a file which isn't included
+# by one of the files Git reads on its own; its aliases are then read by running
+# Git once more.
+#
+# Aliases from files included by a location are not considered to belong to it,
+# matching the behavior of `git config <location> --get-regexp`. (Which files
+# are included is worked out by track-includes.awk, which must also be
+# included.)
+#
+# If `list_sources` is set, the path of every file the aliases may have come
+# from is printed (one per line, followed by an empty line) before any aliases
+# are handled, so that the cache can tell when they change. Git reports the
+# paths of the repository's own files relative to the top of its working tree,
+# so `source_prefix` (the output of `git rev-parse --show-cdup`) is prepended to
+# any relative paths to make them relative to the current directory instead.
+
+BEGIN {
+  RS = "\0"
+}
+
+## Turn any string into a shell-style single-quoted string.
+function shell_quote(string) {
+  gsub(/'/, "'\\''", string)
+
+  return "'" string "'"
+}
+
+## Splits a record containing a key and value (separated by a newline) into the
+## globals `key` and `value`.
+function split_entry(record,    newline) {
+  newline = index(record, "\n")
+
+  if (newline) {
+    key = substr(record, 1, newline - 1)
+    value = substr(record, newline + 1)
+  } else {
+    # Keys without a value aren't followed by a newline.
+    key = record
+    value = ""
+  }
+}
+
+## Adds an alias definition to those found in `location`, unless it won't be
+## displayed anyway.
+function add_alias(location, name, body) {
+  if (!is_wanted(name)) {
+    return
+  }
+
+  alias_count[location]++
+  alias_names[location, alias_count[location]] = name
+  alias_bodies[location, alias_count[location]] = body
+}
+
+# Each entry is made up of three records: the scope, the origin, and the key
+# and value (separated by a newline).
+{
+  field = (NR - 1) % 3
+}
+
+field == 0 {
+  scope = $0
+  scopes_seen[scope] = 1
+}
+
+field == 1 {
+  origin = $0
+}
+
+field == 2 {
+  split_entry($0)
+
+  if (list_sources && substr(origin, 1, 5) == "file:" && !(origin in is_source)) {
+    is_source[origin] = 1
+    sources[++source_count] = substr(origin, 6)
+
+    if (substr(sources[source_count], 1, 1) != "/") {
+      sources[source_count] = source_prefix sources[source_count]
+    }
+  }
+
+  track_includes(origin, key, value)
+
+  if (key == "git-alias.config-file") {
+    configured_location = value
+  } else if (scope == "local" && key == "extensions.worktreeconfig") {
+    worktree_config = value ~ /^([Tt][Rr][Uu][Ee]|[Yy][Ee][Ss]|[Oo][Nn]|[1-9][0-9]*)$/
+  } else if (substr(key, 1, 6) == "alias.") {
+    # Aliases set on the command line (e.g. by `git -c`) can't be in the
+    # configured location, so there's no need to hold on to them.
+    if (scope == "command") {
+      next
+    }
+
+    if (include_depth == 0) {
+      add_alias("--" scope, substr(key, 7), value)
+    } else if (include_count[origin] == 1) {
+      # Only the first time a file is included is considered, in case it is
+      # included more than once.
+      add_alias(origin, substr(key, 7), value)
+    }
+  }
+}
+
+END {
+  if (configured_location == "") {
+    location = "--global"
+  } else if (configured_location ~ /^--(global|local|system|worktree)$/) {
+    location = configured_location
+  } else {
+    location = "file:" configured_location
+    sub(/^file:--file /, "file:", location)
+  }
+
+  # Without worktree-specific configuration, `--worktree` is the same as
+  # `--local`.
+  if (location == "--worktree" && !worktree_config) {
+    location = "--local"
+  }
+
+  # If the file isn't included by any other, it must be read separately.
+  is_separate = substr(location, 1, 5) == "file:" && !(location in alias_count)
+
+  # A repository's own configuration always has some settings in it, so having
+  # none at all most likely means there's no repository. Git is asked for its
+  # aliases separately, so that it can report that (or, if there is one after
+  # all, list them).
+  is_missing_local = location == "--local" && !("local" in scopes_seen)
+
+  if (list_sources) {
+    for (i = 1; i <= source_count; i++) {
+      print sources[i]
+    }
+
+    if (is_separate) {
+      print substr(location, 6)
+    }
+
+    print ""
+  }
+
+  if (is_separate || is_missing_local) {
+    # Its aliases are passed along as they're read rather than being collected
+    # first.
+    if (is_separate) {
+      command = "git config --file " shell_quote(substr(location, 6)) " --null --get-regexp '^alias\\.'"
+    } else {
+      command = "git config --local --null --get-regexp '^alias\\.'"
+    }
+
+    while ((command | getline) > 0) {
+      split_entry($0)
+      handle_if_wanted(substr(key, 7), value)
+    }
+
+    # Git exits with a status of 1 if there are no aliases, but anything else
+    # means it has already reported an error.
+    if (close(command) > 1) {
+      exit 1
+    }
+  } else {
+    for (i = 1; i <= alias_count[location]; i++) {
+      handle_if_wanted(alias_names[location, i], alias_bodies[location, i])
+
+      # Let go of each alias as soon as it has been handled.
+      delete alias_names[location, i]
+      delete alias_bodies[location, i]
+    }
+  }
+}
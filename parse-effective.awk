@@ -0,0 +1,112 @@
+# Finds every alias definition in the output of `git config --list --show-scope
+# --show-origin --null`, whichever scope or file it comes from, and calls a
+# function named `handle` (which must be provided by a separate script) once for
+# each alias with the definition which takes effect: the last one Git reads.
+# Aliases are passed to `handle` via `handle_if_wanted`, which is provided by
+# select-aliases.awk.
+#
+# A file which is included more than once contributes its definitions only
+# once, from the last place it was included (which is where they take effect).
+# This relies on track-includes.awk, which must also be included.
+#
+# Before each call, the following globals are set to describe where the
+# definition came from, so that formatters can include it when `effective` is
+# set:
+#
+# - `alias_scope` and `alias_origin` are the scope and origin (as reported by
+#   Git) of the effective definition.
+# - `shadowed_count` is the number of other definitions of the alias, which it
+#   overrides. For each of them (from 1 to `shadowed_count`, in the order in
+#   which Git reads them), `shadowed_scope`, `shadowed_origin`, and
+#   `shadowed_body` hold its scope, origin, and body.
+
+BEGIN {
+  RS = "\0"
+  effective = 1
+}
+
+## Splits a record containing a key and value (separated by a newline) into the
+## globals `key` and `value`.
+function split_entry(record,    newline) {
+  newline = index(record, "\n")
+
+  if (newline) {
+    key = substr(record, 1, newline - 1)
+    value = substr(record, newline + 1)
+  } else {
+    # Keys without a value aren't followed by a newline.
+    key = record
+    value = ""
+  }
+}
+
+# Each entry is made up of three records: the scope, the origin, and the key
+# and value (separated by a newline).
+{
+  field = (NR - 1) % 3
+}
+
+field == 0 {
+  scope = $0
+}
+
+field == 1 {
+  origin = $0
+}
+
+field == 2 {
+  split_entry($0)
+  track_includes(origin, key, value)
+
+  if (substr(key, 1, 6) != "alias.") {
+    next
+  }
+
+  name = substr(key, 7)
+
+  if (!is_wanted(name)) {
+    next
+  }
+
+  if (!(name in definition_count)) {
+    names[++name_count] = name
+  }
+
+  count = ++definition_count[name]
+  definition_scopes[name, count] = scope
+  definition_origins[name, count] = origin
+  definition_bodies[name, count] = value
+  definition_inclusions[name, count] = include_depth ? include_count[origin] : 0
+}
+
+## Returns 1 if the numbered definition of the named alias came from a copy of an
+## included file which was included again later, or 0 otherwise.
+function is_repeated(name, i,    inclusion) {
+  inclusion = definition_inclusions[name, i]
+
+  return inclusion && inclusion != include_count[definition_origins[name, i]]
+}
+
+END {
+  for (i = 1; i <= name_count; i++) {
+    name = names[i]
+    count = definition_count[name]
+    shadowed_count = 0
+
+    # The last definition is never from a repeated inclusion, as it was read
+    # after all of them.
+    for (j = 1; j < count; j++) {
+      if (!is_repeated(name, j)) {
+        shadowed_count++
+        shadowed_scope[shadowed_count] = definition_scopes[name, j]
+        shadowed_origin[shadowed_count] = definition_origins[name, j]
+        shadowed_body[shadowed_count] = definition_bodies[name, j]
+      }
+    }
+
+    alias_scope = definition_scopes[name, count]
+    alias_origin = definition_origins[name, count]
+
+    handle_if_wanted(name, definition_bodies[name, count])
+  }
+}
@@ -0,0 +1,142 @@
+# Finds all alias definitions in the output of `git alias --config` or
+# `git alias --config-no-header` (or, indeed, any Git configuration file) and
+# calls a function named `handle` (which must be provided by a separate script)
+# with the name and body of each one (or `fail` with an error message if the
+# input can't be parsed). Variables which appear before any section header are
+# taken to be aliases.
+#
+# Values are decoded the same way Git decodes them, including quoting, escape
+# sequences, comments, and continuation lines.
+
+BEGIN {
+  in_alias = 1
+}
+
+## Decodes the (remainder of the) value in `text`, appending it to the global
+## `value`. Returns 1 if the value continues onto the next line or 0 if it is
+## complete. Whether the value is inside a double-quoted string is tracked in
+## the global `in_quote` and the amount of unquoted whitespace not yet known to
+## be internal to the value in `spaces`.
+function decode_value(text,    char, next_char) {
+  while (match(text, /[ \t;#\\"]/)) {
+    if (RSTART > 1) {
+      add_to_value(substr(text, 1, RSTART - 1))
+    }
+
+    char = substr(text, RSTART, 1)
+    text = substr(text, RSTART + 1)
+
+    if (char == "\"") {
+      in_quote = !in_quote
+      add_to_value("")
+    } else if (in_quote && char != "\\") {
+      add_to_value(char)
+    } else if (char == " " || char == "\t") {
+      # Leading whitespace is discarded; other whitespace is retained only if
+      # something follows it.
+      if (value != "") {
+        spaces = spaces " "
+      }
+    } else if (char != "\\") {
+      # The rest of the line is a comment.
+      return 0
+    } else if (text == "") {
+      return 1
+    } else {
+      next_char = substr(text, 1, 1)
+      text = substr(text, 2)
+
+      if (next_char == "n") {
+        add_to_value("\n")
+      } else if (next_char == "t") {
+        add_to_value("\t")
+      } else if (next_char == "b") {
+        add_to_value("\b")
+      } else if (next_char == "\\" || next_char == "\"") {
+        add_to_value(next_char)
+      } else {
+        fail("Invalid escape sequence \"\\" next_char "\" on line " NR ".")
+      }
+    }
+  }
+
+  if (text != "") {
+    add_to_value(text)
+  }
+
+  if (in_quote) {
+    fail("Unterminated quoted string on line " NR ".")
+  }
+
+  return 0
+}
+
+## Appends `text` to the global `value`, preceded by any pending whitespace.
+function add_to_value(text) {
+  value = value spaces text
+  spaces = ""
+}
+
+## Passes the alias whose value was just decoded to `handle`.
+function finish_alias() {
+  if (name != "") {
+    handle(name, value)
+  }
+
+  name = ""
+}
+
+{
+  line = $0
+
+  if (continued) {
+    continued = decode_value(line)
+
+    if (!continued) {
+      finish_alias()
+    }
+
+    next
+  }
+
+  if (match(line, /^[ \t]*\[[^]]*\]/)) {
+    header = substr(line, RSTART, RLENGTH)
+    line = substr(line, RLENGTH + 1)
+
+    sub(/^[ \t]*\[/, "", header)
+    in_alias = tolower(header) == "alias]"
+  }
+
+  if (match(line, /^[ \t]*([;#].*)?$/)) {
+    next
+  }
+
+  if (!match(line, /^[ \t]*[A-Za-z][A-Za-z0-9-]*[ \t]*/)) {
+    fail("Unrecognized line " NR ".")
+  }
+
+  variable = substr(line, 1, RLENGTH)
+  line = substr(line, RLENGTH + 1)
+
+  gsub(/[ \t]/, "", variable)
+
+  if (substr(line, 1, 1) != "=") {
+    fail("The variable \"" variable "\" on line " NR " has no value.")
+  }
+
+  name = in_alias ? variable : ""
+  value = ""
+  spaces = ""
+  in_quote = 0
+  continued = decode_value(substr(line, 2))
+
+  if (!continued) {
+    finish_alias()
+  }
+}
+
+END {
+  if (continued && !failed) {
+    fail("Unterminated value at end of input.")
+  }
+}
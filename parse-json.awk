@@ -0,0 +1,135 @@
+# Finds all alias definitions in the output of `git alias --json` or
+# `git alias --json-compact` (a single JSON object whose keys are alias names
+# and whose values are alias bodies) and calls a function named `handle` (which
+# must be provided by a separate script) with the name and body of each one (or
+# `fail` with an error message if the input can't be parsed).
+#
+# The input is tokenized one line at a time. This is possible because JSON
+# strings can't contain literal newlines, so no token ever spans lines.
+
+BEGIN {
+  # What the parser expects to see next.
+  expecting = "{"
+
+  hex_digits = "0123456789abcdef"
+}
+
+## Decodes the JSON string at the start of `text`, storing it in the global
+## `string` and returning the remainder of `text`.
+function read_string(text,    char, code) {
+  string = ""
+  text = substr(text, 2)
+
+  while (match(text, /["\\]/)) {
+    string = string substr(text, 1, RSTART - 1)
+    char = substr(text, RSTART, 1)
+    text = substr(text, RSTART + 1)
+
+    if (char == "\"") {
+      return text
+    }
+
+    char = substr(text, 1, 1)
+    text = substr(text, 2)
+
+    if (char == "n") {
+      string = string "\n"
+    } else if (char == "t") {
+      string = string "\t"
+    } else if (char == "r") {
+      string = string "\r"
+    } else if (char == "b") {
+      string = string "\b"
+    } else if (char == "f") {
+      string = string "\f"
+    } else if (char == "u" && match(text, /^[0-9A-Fa-f][0-9A-Fa-f][0-9A-Fa-f][0-9A-Fa-f]/)) {
+      code = hex_value(substr(text, 1, 4))
+      text = substr(text, 5)
+
+      # Combine surrogate pairs into a single code point.
+      if (code >= 55296 && code < 56320 && match(text, /^\\u[dD][c-fC-F][0-9A-Fa-f][0-9A-Fa-f]/)) {
+        code = 65536 + (code - 55296) * 1024 + hex_value(substr(text, 3, 4)) - 56320
+        text = substr(text, 7)
+      }
+
+      string = string utf8(code)
+    } else if (char == "\"" || char == "\\" || char == "/") {
+      string = string char
+    } else {
+      fail("Invalid escape sequence in string on line " NR ".")
+    }
+  }
+
+  fail("Unterminated string on line " NR ".")
+}
+
+## Converts a string of hexadecimal digits to a number.
+function hex_value(digits,    i, value) {
+  digits = tolower(digits)
+
+  for (i = 1; i <= length(digits); i++) {
+    value = value * 16 + index(hex_digits, substr(digits, i, 1)) - 1
+  }
+
+  return value
+}
+
+## Encodes a Unicode code point as UTF-8. This must be run in the C locale, as
+## some awks (such as gawk) otherwise encode each byte as a character of its own.
+function utf8(code) {
+  if (code < 128) {
+    return sprintf("%c", code)
+  }
+
+  if (code < 2048) {
+    return sprintf("%c%c", 192 + int(code / 64), 128 + code % 64)
+  }
+
+  if (code < 65536) {
+    return sprintf("%c%c%c", 224 + int(code / 4096), 128 + int(code / 64) % 64, 128 + code % 64)
+  }
+
+  return sprintf("%c%c%c%c", 240 + int(code / 262144), 128 + int(code / 4096) % 64, 128 + int(code / 64) % 64, 128 + code % 64)
+}
+
+{
+  text = $0
+
+  for (;;) {
+    sub(/^[ \t\r]+/, "", text)
+
+    if (text == "") {
+      break
+    }
+
+    token = substr(text, 1, 1)
+
+    if (expecting == "end") {
+      fail("Unexpected text after the end of the object on line " NR ".")
+    }
+
+    if (token == "\"" && (expecting == "name" || expecting == "name or }")) {
+      text = read_string(text)
+      name = string
+      expecting = ":"
+    } else if (token == "\"" && expecting == "body") {
+      text = read_string(text)
+      handle(name, string)
+      expecting = ", or }"
+    } else if (token == "," && expecting == ", or }") {
+      text = substr(text, 2)
+      expecting = "name"
+    } else if (token == expecting || token == "}" && expecting ~ /}$/) {
+      text = substr(text, 2)
+      expecting = token == "{" ? "name or }" : token == ":" ? "body" : "end"
+    } else {
+      fail("Expected " expecting " but found \"" token "\" on line " NR ".")
+    }
+  }
+}
+
+END {
+  if (expecting != "end" && !failed) {
+    fail("Unexpected end of input; expected " expecting ".")
+  }
+}
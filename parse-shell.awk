@@ -0,0 +1,39 @@
+# Finds all alias definitions in the output of `git alias --shell` (that is,
+# lines of the form `git alias <name> <body>...`) and calls a function named
+# `handle` (which must be provided by a separate script) with the name and body
+# of each one (or `fail` with an error message if the input can't be parsed).
+# As when invoking `git alias` directly, multiple body words are joined by
+# spaces.
+#
+# Words may be quoted using single quotes, double quotes, or backslashes, just
+# as they would be when executed by the shell, and quoted words may span
+# multiple lines (see shell-words.awk, which must also be included). Blank
+# lines and comments are ignored.
+
+{
+  if (!split_words($0)) {
+    next
+  }
+
+  if (word_count > 0) {
+    if (word_count < 4 || words[1] != "git" || words[2] != "alias" || words[3] ~ /^-/) {
+      fail("Line " NR " is not a `git alias <name> <body>` command.")
+    }
+
+    body = words[4]
+
+    for (i = 5; i <= word_count; i++) {
+      body = body " " words[i]
+    }
+
+    handle(words[3], body)
+  }
+
+  word_count = 0
+}
+
+END {
+  if (state != "" && !failed) {
+    fail("Unterminated quoted string at end of input.")
+  }
+}
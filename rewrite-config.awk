@@ -0,0 +1,257 @@
+## Collects alias definitions (via `handle`, so that it can be paired with any
+## of the parse-*.awk scripts) and removals (via `unset_alias`), then applies
+## all of them at once in the END block by printing a rewritten copy of the Git
+## configuration file named by `config_file`.
+##
+## Existing definitions of an alias which is being (re)defined are replaced in
+## place, any further definitions of it are dropped, and aliases which didn't
+## exist yet are added to the end of the last `[alias]` section (or a new one,
+## if the file doesn't have one). Everything else in the file, including
+## comments and formatting, is copied verbatim.
+
+BEGIN {
+  # The path of the configuration file is passed as the only operand, which
+  # leaves stdin free for reading the aliases to define.
+  config_file = ARGV[1]
+  delete ARGV[1]
+}
+
+## Records the supplied alias name and body as a definition to be applied. If
+## `unsetting` is set, the alias is recorded as one to be removed instead.
+function handle(name, body,    key) {
+  if (unsetting) {
+    unset_alias(name)
+
+    return
+  }
+
+  if (name !~ /^[A-Za-z][A-Za-z0-9-]*$/) {
+    fail("Invalid alias name \"" name "\".")
+  }
+
+  key = tolower(name)
+
+  if (!(key in edits)) {
+    edit_order[++edit_count] = key
+  }
+
+  edits[key] = "set"
+  edit_names[key] = name
+  edit_bodies[key] = body
+}
+
+## Records the supplied alias name as one to be removed. (Edits may also be
+## dropped by deleting them from `edits`.)
+function unset_alias(name,    key) {
+  key = tolower(name)
+
+  if (!(key in edits)) {
+    edit_order[++edit_count] = key
+  }
+
+  edits[key] = "unset"
+}
+
+## Prints an error message and makes the script exit with a non-zero status
+## without rewriting anything.
+function fail(message) {
+  print message > "/dev/stderr"
+
+  failed = 1
+
+  exit 1
+}
+
+## Turn any string into a gitconfig-style double-quoted string.
+function quote(string) {
+  gsub(/\\/, "&&", string)
+  gsub(/\n/, "\\n", string)
+  gsub(/"/, "\\\"", string)
+
+  return "\"" string "\""
+}
+
+## Determines whether the value beginning in `text` (which may be the remainder
+## of a variable's line or a continuation line) continues onto the next line.
+## Whether the scan ends inside a double-quoted string is tracked in the global
+## `in_quote`, which must be reset before each new variable.
+function value_continues(text,    char) {
+  while (match(text, /["\\;#]/)) {
+    char = substr(text, RSTART, 1)
+
+    if (char == "\\") {
+      if (RSTART == length(text)) {
+        return 1
+      }
+
+      text = substr(text, RSTART + 2)
+    } else {
+      if (char == "\"") {
+        in_quote = !in_quote
+      } else if (!in_quote) {
+        # The rest of the line is a comment.
+        return 0
+      }
+
+      text = substr(text, RSTART + 1)
+    }
+  }
+
+  return 0
+}
+
+## Classifies a single line of the configuration file, updating the globals
+## which describe it:
+##
+## - `continued` is true if the line is the continuation of a value.
+## - `in_alias` is true if the line belongs to an `[alias]` section.
+## - `is_header` is true if the line begins a new section.
+## - `variable` is the lowercase name of the variable defined on the line, if
+##   any.
+## - `prefix` is the portion of the line which precedes the variable.
+## - `more` is true if the value continues onto the next line.
+function classify(line,    rest, name) {
+  continued = more
+  is_header = 0
+  variable = ""
+  prefix = ""
+
+  if (continued) {
+    more = value_continues(line)
+
+    return
+  }
+
+  more = 0
+  rest = line
+
+  if (match(rest, /^[ \t]*\[/)) {
+    is_header = 1
+    rest = substr(rest, RLENGTH + 1)
+
+    if (match(rest, /^[A-Za-z0-9.-]*\]/)) {
+      name = substr(rest, 1, RLENGTH - 1)
+      in_alias = tolower(name) == "alias"
+    } else {
+      # Subsections are never aliases.
+      in_alias = 0
+
+      if (!match(rest, /^[A-Za-z0-9.-]+[ \t]+"([^"\\]|\\.)*"\]/)) {
+        # Not a valid header; Git will complain about it, so let it.
+        return
+      }
+    }
+
+    prefix = substr(line, 1, length(line) - length(rest) + RLENGTH)
+    rest = substr(rest, RLENGTH + 1)
+  }
+
+  if (match(rest, /^[ \t]*[A-Za-z][A-Za-z0-9-]*/)) {
+    name = substr(rest, 1, RLENGTH)
+    sub(/^[ \t]*/, "", name)
+
+    prefix = prefix substr(rest, 1, RLENGTH - length(name))
+    variable = tolower(name)
+    in_quote = 0
+    more = value_continues(substr(rest, RLENGTH + 1))
+  }
+}
+
+## Scans the configuration file to find which aliases already exist and the
+## line after which any new ones should be added.
+function scan_config_file(    line, line_number) {
+  in_alias = 0
+  more = 0
+  append_after = 0
+
+  while ((getline line < config_file) > 0) {
+    line_number++
+
+    classify(line)
+
+    if (!in_alias) {
+      continue
+    }
+
+    if (is_header || variable != "" || continued) {
+      append_after = line_number
+    }
+
+    if (variable != "") {
+      existing[variable] = 1
+    }
+  }
+
+  close(config_file)
+}
+
+## Prints the definitions of all aliases which didn't already exist.
+function print_new_aliases(indent,    i, key) {
+  for (i = 1; i <= edit_count; i++) {
+    key = edit_order[i]
+
+    if (key in edits && edits[key] == "set" && !(key in existing)) {
+      print indent edit_names[key] " = " quote(edit_bodies[key])
+    }
+  }
+}
+
+END {
+  if (failed) {
+    exit 1
+  }
+
+  # The configuration file is read line by line, whatever the parser read its
+  # input as (parse-aliases.awk, for example, reads NUL-terminated records).
+  RS = "\n"
+
+  scan_config_file()
+
+  in_alias = 0
+  more = 0
+  dropping = 0
+
+  while ((getline line < config_file) > 0) {
+    line_number++
+
+    classify(line)
+
+    if (continued) {
+      if (!dropping) {
+        print line
+      }
+    } else if (in_alias && variable in edits) {
+      dropping = 1
+
+      if (edits[variable] == "set" && !(variable in written)) {
+        written[variable] = 1
+
+        print prefix edit_names[variable] " = " quote(edit_bodies[variable])
+      } else if (is_header) {
+        # Keep the header, even though the variable following it is gone.
+        print prefix
+      }
+    } else {
+      dropping = 0
+
+      print line
+    }
+
+    if (line_number == append_after) {
+      print_new_aliases("\t")
+    }
+  }
+
+  close(config_file)
+
+  if (!append_after) {
+    for (i = 1; i <= edit_count; i++) {
+      if (edit_order[i] in edits && edits[edit_order[i]] == "set") {
+        print "[alias]"
+        print_new_aliases("\t")
+
+        break
+      }
+    }
+  }
+}
@@ -0,0 +1,91 @@
+# Decides which aliases are displayed. If any alias names are passed as
+# operands, only the aliases with those names are passed on to `handle`
+# (otherwise, all of them are). Names are compared exactly, other than ignoring
+# case (as Git does), so nothing in them is treated as a pattern.
+#
+# If `matching` is set, the operands are instead `case`-style patterns (see
+# glob-patterns.awk, which must also be included) and the aliases whose names
+# match any of them are passed on. Patterns which don't match anything aren't
+# reported, as there's nothing wrong with an empty listing.
+#
+# Parsers should call `handle_if_wanted` rather than `handle`, and may call
+# `is_wanted` to avoid holding on to aliases which will never be displayed.
+#
+# If none of the named aliases are found, an error is reported for each of them
+# and the script exits before any END blocks which follow this one. Otherwise,
+# `report_missing` must be called after the formatter has finished, to report
+# any which weren't found.
+
+BEGIN {
+  for (i = 1; i < ARGC; i++) {
+    # Skip any operands which an earlier script (such as rewrite-config.awk)
+    # has already taken for itself.
+    if (!(i in ARGV)) {
+      continue
+    }
+
+    if (matching) {
+      patterns[++pattern_count] = glob_to_regex(ARGV[i])
+      delete ARGV[i]
+
+      continue
+    }
+
+    key = tolower(ARGV[i])
+
+    if (!(key in wanted)) {
+      wanted[key] = ARGV[i]
+      wanted_order[++wanted_count] = key
+    }
+
+    delete ARGV[i]
+  }
+}
+
+## Returns 1 if the named alias should be displayed or 0 if it shouldn't.
+function is_wanted(name,    i) {
+  if (matching) {
+    for (i = 1; i <= pattern_count; i++) {
+      if (name ~ patterns[i]) {
+        return 1
+      }
+    }
+
+    return 0
+  }
+
+  return !wanted_count || tolower(name) in wanted
+}
+
+## Passes the supplied alias name and body on to `handle` if the alias should be
+## displayed.
+function handle_if_wanted(name, body) {
+  if (is_wanted(name)) {
+    found[tolower(name)] = 1
+    found_any = 1
+
+    handle(name, body)
+  }
+}
+
+## Reports each of the named aliases which wasn't found. If there were any, the
+## script exits with a status of 1.
+function report_missing(    i, missing) {
+  for (i = 1; i <= wanted_count; i++) {
+    if (!(wanted_order[i] in found)) {
+      print "No alias named \"" wanted[wanted_order[i]] "\" exists." > "/dev/stderr"
+
+      missing = 1
+    }
+  }
+
+  if (missing) {
+    exit 1
+  }
+}
+
+END {
+  if (wanted_count && !found_any) {
+    report_missing()
+  }
+}
@@ -0,0 +1,108 @@
+# Splits lines of input into words the same way the shell would, for use by
+# the parsers which read commands (parse-shell.awk and parse-batch.awk). Words
+# may be quoted using single quotes, double quotes, or backslashes, and quoted
+# words may span multiple lines. A "#" at the start of a word begins a comment.
+
+## Splits the supplied line into words, storing them in the global `words`
+## array (and their count in `word_count`). Returns 1 if the command is
+## complete or 0 if it continues onto the next line, in which case the globals
+## `word`, `in_word`, and `state` hold the unfinished word.
+function split_words(line,    char, next_char, position) {
+  while (line != "") {
+    if (state == "'") {
+      if (!(position = index(line, "'"))) {
+        word = word line "\n"
+
+        return 0
+      }
+
+      word = word substr(line, 1, position - 1)
+      line = substr(line, position + 1)
+      state = ""
+
+      continue
+    }
+
+    if (state == "\"") {
+      if (!match(line, /["\\]/)) {
+        word = word line "\n"
+
+        return 0
+      }
+
+      word = word substr(line, 1, RSTART - 1)
+      char = substr(line, RSTART, 1)
+      next_char = substr(line, RSTART + 1, 1)
+
+      if (char == "\"") {
+        state = ""
+        line = substr(line, RSTART + 1)
+      } else if (next_char == "") {
+        # An escaped newline is removed entirely.
+        return 0
+      } else {
+        # Inside double quotes, backslashes only escape a few characters.
+        word = word (next_char ~ /[\\"$`]/ ? "" : "\\") next_char
+        line = substr(line, RSTART + 2)
+      }
+
+      continue
+    }
+
+    if (!match(line, /[ \t'"\\#]/)) {
+      word = word line
+      in_word = 1
+
+      break
+    }
+
+    if (RSTART > 1) {
+      word = word substr(line, 1, RSTART - 1)
+      in_word = 1
+    }
+
+    char = substr(line, RSTART, 1)
+    line = substr(line, RSTART + 1)
+
+    if (char == " " || char == "\t") {
+      finish_word()
+    } else if (char == "'" || char == "\"") {
+      state = char
+      in_word = 1
+    } else if (char == "\\") {
+      if (line == "") {
+        # An escaped newline is removed entirely.
+        return 0
+      }
+
+      word = word substr(line, 1, 1)
+      in_word = 1
+      line = substr(line, 2)
+    } else if (in_word) {
+      # A "#" only begins a comment at the start of a word.
+      word = word char
+    } else {
+      break
+    }
+  }
+
+  if (state != "") {
+    word = word "\n"
+
+    return 0
+  }
+
+  finish_word()
+
+  return 1
+}
+
+## Adds the word in progress, if any, to the `words` array.
+function finish_word() {
+  if (in_word) {
+    words[++word_count] = word
+  }
+
+  word = ""
+  in_word = 0
+}
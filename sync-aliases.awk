@@ -0,0 +1,85 @@
+## Turns the definitions collected by rewrite-config.awk (which must follow this
+## script) into the smallest set of edits which makes the aliases in the
+## configuration file named by `config_file` match them exactly: aliases which
+## are missing are added, those with a different body are changed, those which
+## are already the same are left alone, and any others are unset.
+##
+## Each edit is reported as it would be by `git unalias` (e.g. `'unset foo'`),
+## prefixed with `report_prefix`, on file descriptor 3. If `dry_run` is set, the
+## script exits after reporting the edits, without rewriting anything.
+
+## Turn any string into a shell-style single-quoted string.
+function shell_quote(string) {
+  gsub(/'/, "'\\''", string)
+
+  return "'" string "'"
+}
+
+## Reports a single edit to the configuration file.
+function report(action, name) {
+  print report_prefix "'" action " " name "'" >> "/dev/fd/3"
+}
+
+END {
+  if (failed) {
+    exit 1
+  }
+
+  # Read the aliases which already exist, keeping the last definition of each
+  # (which is the one Git uses).
+  saved_rs = RS
+  RS = "\0"
+  command = "git config --file " shell_quote(config_file) " --null --get-regexp '^alias\\.'"
+
+  while ((command | getline record) > 0) {
+    newline = index(record, "\n")
+
+    if (newline) {
+      name = substr(record, 7, newline - 7)
+      body = substr(record, newline + 1)
+    } else {
+      name = substr(record, 7)
+      body = ""
+    }
+
+    key = tolower(name)
+
+    if (!(key in existing_bodies)) {
+      existing_order[++existing_count] = key
+      existing_names[key] = name
+    }
+
+    existing_bodies[key] = body
+    definition_count[key]++
+  }
+
+  close(command)
+
+  RS = saved_rs
+
+  for (i = 1; i <= edit_count; i++) {
+    key = edit_order[i]
+    synced[key] = 1
+
+    if (!(key in existing_bodies)) {
+      report("add", edit_names[key])
+    } else if (existing_bodies[key] != edit_bodies[key] || definition_count[key] > 1) {
+      report("change", edit_names[key])
+    } else {
+      delete edits[key]
+    }
+  }
+
+  for (i = 1; i <= existing_count; i++) {
+    key = existing_order[i]
+
+    if (!(key in synced)) {
+      unset_alias(key)
+      report("unset", existing_names[key])
+    }
+  }
+
+  if (dry_run) {
+    exit
+  }
+}
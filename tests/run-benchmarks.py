@@ -0,0 +1,273 @@
+#!/bin/env python3
+
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+from typing import Sequence
+
+from testlib import GitExecutionContext
+
+
+tests_root = (Path.cwd() / Path(__file__)).resolve().parent
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 50000]
+
+LIST_FORMATS = [
+    "--shell",
+    "--config",
+    "--config-no-header",
+    "--json",
+    "--json-compact",
+    "--ndjson",
+    "--null",
+    "--names-only",
+]
+
+
+@dataclass(frozen=True)
+class Operation:
+    name: str
+
+    command_line: Sequence[str]
+    """The command and arguments to execute, as with `Test.command_line`."""
+
+    input: str | None = None
+    """If set, text to supply to the command on its stdin."""
+
+    warm_up: bool = False
+    """If set, the operation is run once before it's timed and the configuration
+    is left as it is afterwards, so that only runs which find anything it caches
+    up to date are measured."""
+
+
+@dataclass(frozen=True)
+class Result:
+    operation: str
+    aliases: int
+    command_line: Sequence[str]
+    exit_code: int
+    wall_seconds: Sequence[float]
+    min_wall_seconds: float
+    median_wall_seconds: float
+
+    processes: int | None
+    """The number of processes started by a single run of the operation
+    (including the one running the command itself), or None if that couldn't
+    be determined."""
+
+
+def make_body(index: int) -> str:
+    """Returns the body of a synthetic alias, cycling through the kinds of body
+    which are most expensive to parse and format."""
+
+    kind = index % 4
+
+    if kind == 0:
+        return f"log --oneline -n {index}"
+    elif kind == 1:
+        return f'!f() {{\n\techo "{index}"\n\tgit status\n}}; f'
+    elif kind == 2:
+        return f'!echo "a\\tb" \'c\' \\\\ "\\"{index}\\"" # ;'
+    else:
+        return f"!echo {index} " + "very long " * 400
+
+
+def quote(string: str) -> str:
+    """Turn any string into a gitconfig-style double-quoted string."""
+
+    escaped = string.replace("\\", "\\\\").replace('"', '\\"')
+
+    return '"' + escaped.replace("\n", "\\n").replace("\t", "\\t") + '"'
+
+
+def make_config(size: int) -> str:
+    # Writing the file directly is far quicker than running `git config` once
+    # per alias.
+    lines = ["[user]", "\tname = Benchmark", "[alias]"]
+
+    for index in range(size):
+        lines.append(f"\talias-{index} = {quote(make_body(index))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def get_operations(size: int) -> list[Operation]:
+    target = f"alias-{size // 2}"
+
+    return [
+        *(Operation(f"list {flag}", ["git-alias.sh", flag]) for flag in LIST_FORMATS),
+        Operation("list --effective", ["git-alias.sh", "--effective"]),
+        Operation("show one", ["git-alias.sh", target]),
+        Operation("show one (explicit location)", ["git-alias.sh", "--global", target]),
+        Operation("match pattern", ["git-alias.sh", "--match", "alias-1*"]),
+        # Completion is run on every keypress, so it's timed with its index
+        # already built, as it usually would be.
+        Operation(
+            "complete prefix", ["git-alias.sh", "--complete", "zz"], warm_up=True
+        ),
+        Operation("define", ["git-alias.sh", "bench-new", "log", "--oneline"]),
+        Operation("redefine", ["git-alias.sh", target, "log", "--oneline"]),
+        Operation(
+            "import",
+            ["git-alias.sh", "--import"],
+            input="".join(f"git alias imported-{i} 'log -{i}'\n" for i in range(10)),
+        ),
+        Operation("unset one", ["git-unalias.sh", target]),
+        # This matches the same ten aliases whatever the size, so that the time
+        # taken per alias can be compared.
+        Operation("unset pattern", ["git-unalias.sh", "alias-1?"]),
+    ]
+
+
+def read_last_pid() -> int | None:
+    """Returns the ID of the most recently started process (in this PID
+    namespace), as reported by Linux, or None if it isn't available.
+
+    Comparing this before and after an operation counts the processes it
+    started without having to trace it. Anything else started on the machine in
+    the meantime is counted too, so counts are only reliable on a quiet one."""
+
+    try:
+        with open("/proc/loadavg") as file:
+            return int(file.read().split()[-1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def run_operation(
+    context: GitExecutionContext, config: str, operation: Operation, repeat: int
+) -> tuple[int, list[float], int | None]:
+    config_path = Path(context.env["GIT_CONFIG_GLOBAL"])
+    wall_seconds = []
+    processes = None
+    exit_code = 0
+
+    if operation.warm_up:
+        config_path.write_text(config)
+        context.execute_command(operation.command_line, input=operation.input)
+
+    for run in range(repeat):
+        # Every run starts from the same configuration, as some of the
+        # operations change it.
+        if not operation.warm_up:
+            config_path.write_text(config)
+
+        first_pid = read_last_pid()
+        start = time.perf_counter()
+        result = context.execute_command(operation.command_line, input=operation.input)
+        wall_seconds.append(time.perf_counter() - start)
+        last_pid = read_last_pid()
+
+        exit_code = result.returncode
+
+        # The PIDs may have wrapped around, in which case there's no telling.
+        if run == 0 and first_pid is not None and last_pid is not None:
+            processes = last_pid - first_pid if last_pid > first_pid else None
+
+    return exit_code, wall_seconds, processes
+
+
+def run_benchmarks(sizes: Sequence[int], *, repeat: int) -> list[Result]:
+    results = []
+
+    for size in sizes:
+        context = GitExecutionContext()
+        config = make_config(size)
+
+        context.env["XDG_CACHE_HOME"] = str(context.base_dir / "cache")
+
+        for operation in get_operations(size):
+            exit_code, wall_seconds, processes = run_operation(
+                context, config, operation, repeat
+            )
+
+            results.append(
+                Result(
+                    operation=operation.name,
+                    aliases=size,
+                    command_line=operation.command_line,
+                    exit_code=exit_code,
+                    wall_seconds=wall_seconds,
+                    min_wall_seconds=min(wall_seconds),
+                    median_wall_seconds=statistics.median(wall_seconds),
+                    processes=processes,
+                )
+            )
+
+            print(
+                f"{size:>6} aliases  {operation.name:<30}"
+                f" {min(wall_seconds):8.3f}s"
+                f"  {'?' if processes is None else processes:>4} process(es)",
+                file=sys.stderr,
+            )
+
+    return results
+
+
+def get_commit() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=tests_root,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Time git-alias and git-unalias against synthetic configuration files."
+    )
+
+    parser.add_argument(
+        "sizes",
+        help=f"The numbers of aliases to benchmark with (default: {DEFAULT_SIZES}).",
+        nargs="*",
+        type=int,
+        default=DEFAULT_SIZES,
+        metavar="size",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        help="The number of times to run each operation (default: 3).",
+        type=int,
+        default=3,
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="The file to write the results to, as JSON (default: stdout).",
+    )
+
+    if sys.version_info < (3, 10, 0):
+        parser.error("Running benchmarks requires Python 3.10 or higher.")
+
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+
+    results = run_benchmarks(args.sizes, repeat=args.repeat)
+    document = {
+        "commit": get_commit(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
@@ -0,0 +1,78 @@
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+EXISTING = {"foo": "diff", "fob": "log", "st": "status"}
+
+
+def get_suite() -> Suite:
+    contexts = [GitExecutionContext() for _ in range(4)]
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--batch",
+                [
+                    Test(
+                        "applies all the edits in order",
+                        ["git-alias.sh", "--global", "--batch"],
+                        contexts[0],
+                        define_aliases={("--global",): EXISTING},
+                        input=(
+                            "# Set up some aliases.\n"
+                            "set co checkout\n"
+                            "unset 'fo*'\n"
+                            "set lg '!git log --graph'\n"
+                            "set foo show --stat\n"
+                            "\n"
+                            "unset st\n"
+                        ),
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={
+                            ("--global",): {
+                                "foo": "show --stat",
+                                "co": "checkout",
+                                "lg": "!git log --graph",
+                            }
+                        },
+                    ),
+                    Test(
+                        "unsets aliases set earlier in the batch",
+                        ["git-alias.sh", "--global", "--batch"],
+                        contexts[1],
+                        input="set new log\nunset new\n",
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={("--global",): {}},
+                    ),
+                    Test(
+                        "changes nothing if a pattern doesn't match",
+                        ["git-alias.sh", "--global", "--batch"],
+                        contexts[2],
+                        define_aliases={("--global",): EXISTING},
+                        input="set co checkout\nunset 'nope*'\nunset st\n",
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr='No aliases matching "nope*" were found.\n',
+                        ),
+                        aliases={("--global",): EXISTING},
+                    ),
+                    Test(
+                        "changes nothing if a line can't be understood",
+                        ["git-alias.sh", "--global", "--batch"],
+                        contexts[3],
+                        define_aliases={("--global",): EXISTING},
+                        input="unset st\nset co\n",
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="Line 2 is not a `set <name> <body>` or `unset <pattern>` command.\n",
+                        ),
+                        aliases={("--global",): EXISTING},
+                    ),
+                ],
+            )
+        ],
+    )
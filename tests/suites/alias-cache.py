@@ -0,0 +1,133 @@
+import os
+import re
+
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+def get_suite() -> Suite:
+    context = GitExecutionContext()
+    cache_dir = context.base_dir / "cache"
+    no_git_dir = context.base_dir / "no-git"
+
+    context.env["GIT_ALIAS_CACHE"] = "1"
+    context.env["XDG_CACHE_HOME"] = str(cache_dir)
+
+    # A stand-in for Git which fails, proving that it wasn't needed.
+    os.mkdir(no_git_dir)
+    (no_git_dir / "git").write_text("#!/bin/sh\nexit 99\n")
+    (no_git_dir / "git").chmod(0o755)
+
+    without_git = ["env", f"PATH={no_git_dir}{os.pathsep}{context.env['PATH']}"]
+
+    # Git reports the repository's own files relative to the top of its working
+    # tree, which must be taken into account when run from a subdirectory.
+    subdir = GitExecutionContext()
+
+    subdir.env["GIT_ALIAS_CACHE"] = "1"
+    subdir.env["XDG_CACHE_HOME"] = str(subdir.base_dir / "cache")
+    subdir.execute_command(["git", "config", "git-alias.config-file", "--local"])
+    os.mkdir(subdir.repo_dir / "sub")
+
+    in_subdir = ["sh", "-c", 'cd sub && exec "$@"', "sh"]
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "cache",
+                [
+                    Test(
+                        "fills the cache",
+                        ["git-alias.sh"],
+                        context,
+                        define_aliases={("--global",): {"foo": "diff"}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\n", stderr=""
+                        ),
+                    ),
+                    Test(
+                        "shows aliases from the cache without running Git",
+                        [*without_git, "git-alias.sh", "--json-compact"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout='{"foo":"diff"}', stderr=""),
+                    ),
+                    Test(
+                        "selects aliases from the cache",
+                        [*without_git, "git-alias.sh", "--show", "foo", "bar"],
+                        context,
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\n",
+                            stderr='No alias named "bar" exists.\n',
+                        ),
+                    ),
+                    Test(
+                        "notices changes made by Git",
+                        ["git-alias.sh", "--global"],
+                        context,
+                        define_aliases={("--global",): {"foo": "log"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="git alias foo 'log'\n", stderr=""),
+                    ),
+                    Test(
+                        "is cleared when an alias is defined",
+                        [
+                            "sh",
+                            "-c",
+                            'git-alias.sh bar show && test ! -e "$XDG_CACHE_HOME/git-alias"',
+                        ],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                    ),
+                    Test(
+                        "is cleared when an alias is removed",
+                        [
+                            "sh",
+                            "-c",
+                            'git-alias.sh >/dev/null && git-unalias.sh bar && test ! -e "$XDG_CACHE_HOME/git-alias"',
+                        ],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="'unset bar'\n", stderr=""),
+                    ),
+                    Test(
+                        "fills the cache from a subdirectory",
+                        [*in_subdir, "git-alias.sh"],
+                        subdir,
+                        define_aliases={("--local",): {"l1": "log"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="git alias l1 'log'\n", stderr=""),
+                    ),
+                    Test(
+                        "notices changes made by Git from a subdirectory",
+                        [*in_subdir, "git-alias.sh"],
+                        subdir,
+                        define_aliases={("--local",): {"l1": "changed"}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="git alias l1 'changed'\n", stderr=""
+                        ),
+                    ),
+                    Test(
+                        "is only readable by its owner",
+                        [
+                            "sh",
+                            "-c",
+                            'umask 022 && git-alias.sh >/dev/null && ls -ld "$XDG_CACHE_HOME/git-alias" "$XDG_CACHE_HOME/git-alias"/*',
+                        ],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=re.compile(
+                                r"^drwx------ [^\n]*\n(-rw------- [^\n]*\n){2}$"
+                            ),
+                            stderr="",
+                        ),
+                    ),
+                ],
+            )
+        ],
+    )
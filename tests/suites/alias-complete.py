@@ -0,0 +1,91 @@
+import os
+
+from testlib import COMMON_ALIASES, CommandOutput, GitExecutionContext, Suite, Test
+
+
+def get_suite() -> Suite:
+    context = GitExecutionContext()
+    no_git_dir = context.base_dir / "no-git"
+
+    context.env["XDG_CACHE_HOME"] = str(context.base_dir / "cache")
+
+    # A stand-in for Git which fails, proving that it wasn't needed.
+    os.mkdir(no_git_dir)
+    (no_git_dir / "git").write_text("#!/bin/sh\nexit 99\n")
+    (no_git_dir / "git").chmod(0o755)
+
+    without_git = ["env", f"PATH={no_git_dir}{os.pathsep}{context.env['PATH']}"]
+
+    # Git reports the repository's own files relative to the top of its working
+    # tree, which must be taken into account when run from a subdirectory.
+    subdir = GitExecutionContext()
+
+    subdir.env["XDG_CACHE_HOME"] = str(subdir.base_dir / "cache")
+    subdir.execute_command(["git", "config", "git-alias.config-file", "--local"])
+    os.mkdir(subdir.repo_dir / "sub")
+
+    in_subdir = ["sh", "-c", 'cd sub && exec "$@"', "sh"]
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--complete",
+                [
+                    Test(
+                        "prints the sorted names which begin with the prefix",
+                        ["git-alias.sh", "--global", "--complete", "f"],
+                        context,
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(stdout="foo\nfunc\n", stderr=""),
+                    ),
+                    Test(
+                        "prints every name without a prefix",
+                        [*without_git, "git-alias.sh", "--global", "--complete"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="foo\nfunc\nml\n", stderr=""),
+                    ),
+                    Test(
+                        "prints nothing when no names match",
+                        [*without_git, "git-alias.sh", "--global", "--complete", "x"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                    ),
+                    Test(
+                        "notices new aliases",
+                        ["git-alias.sh", "--global", "--complete", "f"],
+                        context,
+                        define_aliases={("--global",): {"fa": "fetch --all"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="fa\nfoo\nfunc\n", stderr=""),
+                    ),
+                    Test(
+                        "uses the configured location by default",
+                        ["git-alias.sh", "--complete", "m"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="ml\n", stderr=""),
+                    ),
+                    Test(
+                        "builds the index from a subdirectory",
+                        [*in_subdir, "git-alias.sh", "--complete", "l"],
+                        subdir,
+                        define_aliases={("--local",): {"lone": "log"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="lone\n", stderr=""),
+                    ),
+                    Test(
+                        "notices new aliases from a subdirectory",
+                        [*in_subdir, "git-alias.sh", "--complete", "l"],
+                        subdir,
+                        define_aliases={("--local",): {"ltwo": "log -p"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="lone\nltwo\n", stderr=""),
+                    ),
+                ],
+            )
+        ],
+    )
@@ -7,6 +7,8 @@ FORMAT_FLAGS = [
     ["--json"],
     ["--json-compact"],
     ["--names-only"],
+    ["--ndjson"],
+    ["--null"],
     ["--shell"],
 ]
 
@@ -0,0 +1,99 @@
+import json
+
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+def get_suite() -> Suite:
+    context = GitExecutionContext()
+    global_origin = f"file:{context.base_dir / 'gitconfig-global'}"
+    system_origin = f"file:{context.base_dir / 'gitconfig-system'}"
+
+    context.add_aliases(("--system",), {"foo": "log", "st": "status"})
+    context.add_aliases(("--global",), {"foo": "show", "ml": "!echo foo\necho bar"})
+    context.add_aliases(("--local",), {"foo": "diff"})
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--effective",
+                [
+                    Test(
+                        "shows the effective definitions and those they shadow",
+                        ["git-alias.sh", "--effective"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=(
+                                f"# system {system_origin} (shadowed)\n"
+                                "# git alias foo 'log'\n"
+                                f"# global {global_origin} (shadowed)\n"
+                                "# git alias foo 'show'\n"
+                                "# local file:.git/config\n"
+                                "git alias foo 'diff'\n"
+                                f"# system {system_origin}\n"
+                                "git alias st 'status'\n"
+                                f"# global {global_origin}\n"
+                                "git alias ml '!echo foo\necho bar'\n"
+                            ),
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "describes each definition in JSON",
+                        [
+                            "git-alias.sh",
+                            "--effective",
+                            "--json-compact",
+                            "--show",
+                            "foo",
+                        ],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=json.dumps(
+                                {
+                                    "foo": {
+                                        "body": "diff",
+                                        "scope": "local",
+                                        "origin": "file:.git/config",
+                                        "shadowed": [
+                                            {
+                                                "body": "log",
+                                                "scope": "system",
+                                                "origin": system_origin,
+                                            },
+                                            {
+                                                "body": "show",
+                                                "scope": "global",
+                                                "origin": global_origin,
+                                            },
+                                        ],
+                                    }
+                                },
+                                separators=(",", ":"),
+                            ),
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "overrides location flags",
+                        ["git-alias.sh", "--global", "--effective", "--names-only"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="foo\nst\nml\n", stderr=""),
+                    ),
+                    Test(
+                        "can't be used to define an alias",
+                        ["git-alias.sh", "--effective", "foo", "diff"],
+                        context,
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="Aliases can't be defined in --effective.\n",
+                        ),
+                    ),
+                ],
+            )
+        ],
+    )
@@ -0,0 +1,138 @@
+import os
+import re
+
+from testlib import (
+    COMMON_ALIASES,
+    NO_ALIASES,
+    CommandOutput,
+    GitExecutionContext,
+    Suite,
+    Test,
+)
+
+
+IMPORT_INPUTS = {
+    "shell": "git alias foo 'diff'\ngit alias ml '!echo foo\necho bar'\ngit alias func '!f() {}; f'\n",
+    "config": '[alias]\n\tfoo = "diff"\n\tml = "!echo foo\\necho bar"\n\tfunc = "!f() {}; f"\n',
+    "config without a header": 'foo = "diff"\nml = "!echo foo\\necho bar"\nfunc = "!f() {}; f"\n',
+    "json": '{\n  "foo": "diff",\n  "ml": "!echo foo\\necho bar",\n  "func": "!f() {}; f"\n}\n',
+    "compact json": '{"foo":"diff","ml":"!echo foo\\necho bar","func":"!f() {}; f"}',
+}
+
+IMPORT_FLAGS = {
+    "shell": [],
+    "config": ["--format", "config"],
+    "config without a header": ["--format", "config"],
+    "json": ["--format", "json"],
+    "compact json": ["--format", "json"],
+}
+
+
+def get_suite() -> Suite:
+    # Git can't be asked for a file's permissions, so they're listed by the
+    # command itself.
+    private = GitExecutionContext()
+    private_path = private.base_dir / "gitconfig-global"
+
+    private_path.write_text("[alias]\n\tst = status\n")
+    os.chmod(private_path, 0o600)
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "import",
+                [
+                    Suite(
+                        "input formats",
+                        [
+                            Test(
+                                name,
+                                [
+                                    "git-alias.sh",
+                                    "--global",
+                                    "--import",
+                                    *IMPORT_FLAGS[name],
+                                ],
+                                input=input,
+                                exit_code=0,
+                                output=CommandOutput(stdout="", stderr=""),
+                                aliases={**NO_ALIASES, ("--global",): COMMON_ALIASES},
+                            )
+                            for name, input in IMPORT_INPUTS.items()
+                        ],
+                    ),
+                    Test(
+                        "replaces existing aliases and keeps the others",
+                        ["git-alias.sh", "--global", "--import"],
+                        input=IMPORT_INPUTS["shell"],
+                        define_aliases={("--global",): {"foo": "log", "st": "status"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={("--global",): {**COMMON_ALIASES, "st": "status"}},
+                    ),
+                    Test(
+                        "preserves backslashes",
+                        ["git-alias.sh", "--global", "--import"],
+                        input="git alias bs '!echo a\\b'\n",
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={**NO_ALIASES, ("--global",): {"bs": "!echo a\\b"}},
+                    ),
+                    Test(
+                        "decodes escaped non-ASCII characters in JSON",
+                        # Some awks would encode each byte as a character of its
+                        # own in a UTF-8 locale.
+                        [
+                            "env",
+                            "LC_ALL=C.UTF-8",
+                            "git-alias.sh",
+                            "--global",
+                            "--import",
+                            "--format",
+                            "json",
+                        ],
+                        input='{"e": "!echo \\u00e9 \\u20ac \\ud83d\\ude00"}\n',
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={
+                            **NO_ALIASES,
+                            ("--global",): {"e": "!echo \u00e9 \u20ac \U0001f600"},
+                        },
+                    ),
+                    Test(
+                        "uses the requested location",
+                        ["git-alias.sh", "--local", "--import"],
+                        input=IMPORT_INPUTS["shell"],
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={**NO_ALIASES, ("--local",): COMMON_ALIASES},
+                    ),
+                    Test(
+                        "keeps the file's permissions",
+                        [
+                            "sh",
+                            "-c",
+                            'git-alias.sh --global --import && ls -l "$GIT_CONFIG_GLOBAL"',
+                        ],
+                        private,
+                        input="git alias foo 'diff'\n",
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=re.compile(r"^-rw------- "), stderr=""
+                        ),
+                        aliases={("--global",): {"st": "status", "foo": "diff"}},
+                    ),
+                    Test(
+                        "changes nothing when the input is invalid",
+                        ["git-alias.sh", "--global", "--import"],
+                        input="git alias foo 'log'\nnot an alias\n",
+                        define_aliases={("--global",): {"st": "status"}},
+                        exit_code=1,
+                        output=CommandOutput(stdout="", stderr=re.compile("^Line 2 ")),
+                        aliases={("--global",): {"st": "status"}},
+                    ),
+                ],
+            )
+        ],
+    )
@@ -0,0 +1,76 @@
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+def get_suite() -> Suite:
+    context = GitExecutionContext()
+    main_path = context.base_dir / "gitconfig-main"
+    shared_path = context.base_dir / "gitconfig-shared"
+    nested_path = context.base_dir / "gitconfig-nested"
+
+    # The shared file is included twice, so its aliases must only be attributed
+    # to it once (from the last time it was included).
+    main_path.write_text(
+        "[alias]\n"
+        "\tmain = log\n"
+        "\tst = status\n"
+        "[include]\n"
+        f"\tpath = {shared_path.name}\n"
+        f"\tpath = {nested_path.name}\n"
+    )
+    shared_path.write_text("[alias]\n\tst = status -sb\n")
+    nested_path.write_text(
+        f"[include]\n\tpath = {shared_path.name}\n[alias]\n\tnested = diff\n"
+    )
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--includes",
+                [
+                    Test(
+                        "attributes aliases to the files they came from",
+                        ["git-alias.sh", "--file", str(main_path), "--includes"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=(
+                                f"# command file:{main_path}\n"
+                                "git alias main 'log'\n"
+                                f"# command file:{main_path} (shadowed)\n"
+                                "# git alias st 'status'\n"
+                                f"# command file:{shared_path}\n"
+                                "git alias st 'status -sb'\n"
+                                f"# command file:{nested_path}\n"
+                                "git alias nested 'diff'\n"
+                            ),
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "only shows the named aliases",
+                        [
+                            "git-alias.sh",
+                            "--file",
+                            str(main_path),
+                            "--includes",
+                            "--names-only",
+                            "--show",
+                            "nested",
+                            "main",
+                        ],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="main\nnested\n", stderr=""),
+                    ),
+                    Test(
+                        "only shows aliases from the location itself without it",
+                        ["git-alias.sh", "--file", str(main_path), "--names-only"],
+                        context,
+                        exit_code=0,
+                        output=CommandOutput(stdout="main\nst\n", stderr=""),
+                    ),
+                ],
+            )
+        ],
+    )
@@ -0,0 +1,71 @@
+from testlib import COMMON_ALIASES, CommandOutput, Suite, Test
+
+
+def get_suite() -> Suite:
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--match",
+                [
+                    Test(
+                        "shows the aliases matching a pattern",
+                        ["git-alias.sh", "--global", "--match", "f*"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\ngit alias func '!f() {}; f'\n",
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "shows the aliases matching any of several patterns once each",
+                        ["git-alias.sh", "--json", "--match", "?l", "fo?", "[!m]*o"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout='{\n  "foo": "diff",\n  "ml": "!echo foo\\necho bar"\n}\n',
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "shows valid output when nothing matches",
+                        ["git-alias.sh", "--global", "--json", "--match", "x*"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(stdout="{}\n", stderr=""),
+                    ),
+                    Test(
+                        "supports character classes",
+                        [
+                            "git-alias.sh",
+                            "--global",
+                            "--names-only",
+                            "--match",
+                            "[[:alpha:]]l",
+                            "*[[:digit:]]",
+                        ],
+                        define_aliases={("--global",): {**COMMON_ALIASES, "v2": "log"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout="ml\nv2\n", stderr=""),
+                    ),
+                    Test(
+                        "treats escaped characters literally",
+                        ["git-alias.sh", "--global", "--match", "f\\*"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                    ),
+                    Test(
+                        "complains when no patterns are given",
+                        ["git-alias.sh", "--global", "--match"],
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="Usage: git alias --match [flags] <pattern>...\n",
+                        ),
+                    ),
+                ],
+            )
+        ],
+    )
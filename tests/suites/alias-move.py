@@ -0,0 +1,138 @@
+import os
+import re
+import shutil
+
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+GLOBAL = {"foo": "diff", "bar": "log --oneline", "baz": '!echo "a\\b"'}
+
+
+def get_suite() -> Suite:
+    contexts = [GitExecutionContext() for _ in range(7)]
+    files = [str(context.base_dir / "gitconfig-aliases") for context in contexts]
+
+    # Make replacing the global file fail, after the other file has already been
+    # replaced.
+    failing_mv = contexts[5].bin_dir / "mv"
+
+    with open(failing_mv, "w") as file:
+        file.write(
+            "#!/bin/sh\n"
+            'case "$3" in */gitconfig-global ) exit 1;; esac\n'
+            f'exec {shutil.which("mv")} "$@"\n'
+        )
+
+    os.chmod(failing_mv, 0o755)
+
+    # Both files are rewritten, so both must keep their permissions.
+    private_paths = [str(contexts[6].base_dir / "gitconfig-global"), files[6]]
+
+    for path in private_paths:
+        with open(path, "w") as file:
+            file.write("[alias]\n\tst = status\n")
+
+        os.chmod(path, 0o600)
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--move",
+                [
+                    Test(
+                        "moves all aliases to another file",
+                        [
+                            "git-alias.sh",
+                            "--move",
+                            "--from",
+                            "--global",
+                            "--to",
+                            files[0],
+                        ],
+                        contexts[0],
+                        define_aliases={("--global",): GLOBAL},
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={("--global",): {}, ("--file", files[0]): GLOBAL},
+                    ),
+                    Test(
+                        "only moves aliases matching the patterns",
+                        ["git-alias.sh", "--move", "--to", "--local", "ba*"],
+                        contexts[1],
+                        define_aliases={("--global",): GLOBAL},
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={
+                            ("--global",): {"foo": "diff"},
+                            ("--local",): {
+                                "bar": "log --oneline",
+                                "baz": '!echo "a\\b"',
+                            },
+                        },
+                    ),
+                    Test(
+                        "replaces aliases which already exist in the destination",
+                        ["git-alias.sh", "--move", "--from", "--local", "foo"],
+                        contexts[2],
+                        define_aliases={
+                            ("--global",): GLOBAL,
+                            ("--local",): {"foo": "show"},
+                        },
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={
+                            ("--global",): {**GLOBAL, "foo": "show"},
+                            ("--local",): {},
+                        },
+                    ),
+                    Test(
+                        "complains when no aliases match",
+                        ["git-alias.sh", "--move", "--to", files[3], "nope*"],
+                        contexts[3],
+                        define_aliases={("--global",): GLOBAL},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="", stderr="No aliases to move were found.\n"
+                        ),
+                        aliases={("--global",): GLOBAL},
+                    ),
+                    Test(
+                        "complains when both locations are the same",
+                        ["git-alias.sh", "--move", "--from", "--global"],
+                        contexts[4],
+                        define_aliases={("--global",): GLOBAL},
+                        exit_code=1,
+                        aliases={("--global",): GLOBAL},
+                    ),
+                    Test(
+                        "restores the destination if the source can't be replaced",
+                        ["git-alias.sh", "--move", "--to", "--local"],
+                        contexts[5],
+                        define_aliases={("--global",): GLOBAL},
+                        exit_code=1,
+                        aliases={("--global",): GLOBAL, ("--local",): {}},
+                    ),
+                    Test(
+                        "keeps the permissions of both files",
+                        [
+                            "sh",
+                            "-c",
+                            'git-alias.sh --move --to "$0" foo && ls -l "$GIT_CONFIG_GLOBAL" "$0"',
+                            files[6],
+                        ],
+                        contexts[6],
+                        define_aliases={("--global",): {"foo": "diff"}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=re.compile(r"^-rw------- .*\n-rw------- "), stderr=""
+                        ),
+                        aliases={
+                            ("--global",): {"st": "status"},
+                            ("--file", files[6]): {"st": "status", "foo": "diff"},
+                        },
+                    ),
+                ],
+            )
+        ],
+    )
@@ -1,7 +1,29 @@
-from testlib import ALIAS_COMMANDS, COMMON_ALIASES, CommandOutput, Suite, Test
+import os.path
+import shutil
+
+from testlib import (
+    ALIAS_COMMANDS,
+    COMMON_ALIASES,
+    CommandOutput,
+    GitExecutionContext,
+    Suite,
+    Test,
+)
 
 
 def get_suite() -> Suite:
+    # A copy of the script can't find the awk scripts on its own, but can be
+    # told where they are.
+    copy_context = GitExecutionContext()
+    scripts_dir = os.path.dirname(
+        os.path.realpath(copy_context.bin_dir / "git-alias-abs")
+    )
+
+    shutil.copy(
+        copy_context.bin_dir / "git-alias-abs", copy_context.bin_dir / "git-alias-copy"
+    )
+    copy_context.env["GIT_ALIAS_HOME"] = scripts_dir
+
     return Suite(
         "alias",
         [
@@ -25,7 +47,15 @@ def get_suite() -> Suite:
                             )
                             for name, command in ALIAS_COMMANDS.items()
                         ],
-                    )
+                    ),
+                    Test(
+                        "finds the awk scripts using GIT_ALIAS_HOME",
+                        ["git", "alias-copy", "--global", "--names-only"],
+                        copy_context,
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(stdout="foo\nml\nfunc\n", stderr=""),
+                    ),
                 ],
             )
         ],
@@ -40,6 +40,14 @@ TEST_PARAMETERS = [
         "{}",
     ),
     TestParameters(["--names-only"], "foo\nml\nfunc\n", ""),
+    TestParameters(
+        ["--ndjson"],
+        '{"name":"foo","body":"diff"}\n{"name":"ml","body":"!echo foo\\necho bar"}\n{"name":"func","body":"!f() {}; f"}\n',
+        "",
+    ),
+    TestParameters(
+        ["--null"], "foo\0diff\0ml\0!echo foo\necho bar\0func\0!f() {}; f\0", ""
+    ),
 ]
 
 
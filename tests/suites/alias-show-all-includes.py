@@ -0,0 +1,78 @@
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+def get_suite() -> Suite:
+    included_file = GitExecutionContext()
+    included_path = str(included_file.base_dir / "gitconfig-aliases")
+
+    included_file.add_aliases(("--global",), {"foo": "diff"})
+    included_file.add_aliases(("--file", included_path), {"bar": "log"})
+    included_file.execute_command(
+        ["git", "config", "--global", "include.path", included_path], check=True
+    )
+    included_file.execute_command(
+        ["git", "config", "--global", "git-alias.config-file", included_path],
+        check=True,
+    )
+
+    including_file = GitExecutionContext()
+    included_path = str(including_file.base_dir / "gitconfig-aliases")
+
+    including_file.add_aliases(("--global",), {"foo": "diff"})
+    including_file.add_aliases(("--file", included_path), {"bar": "log"})
+    including_file.execute_command(
+        ["git", "config", "--global", "include.path", included_path], check=True
+    )
+
+    separate_file = GitExecutionContext()
+    separate_path = str(separate_file.base_dir / "gitconfig-aliases")
+
+    separate_file.add_aliases(("--global",), {"foo": "diff"})
+    separate_file.add_aliases(("--file", separate_path), {"bar": "log"})
+    separate_file.execute_command(
+        ["git", "config", "--global", "git-alias.config-file", separate_path],
+        check=True,
+    )
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "no positional parameters",
+                [
+                    Suite(
+                        "included files",
+                        [
+                            Test(
+                                "shows aliases from a configured file which is included",
+                                ["git-alias.sh", "--shell"],
+                                included_file,
+                                exit_code=0,
+                                output=CommandOutput(
+                                    stdout="git alias bar 'log'\n", stderr=""
+                                ),
+                            ),
+                            Test(
+                                "shows aliases from a configured file which isn't included",
+                                ["git-alias.sh", "--json"],
+                                separate_file,
+                                exit_code=0,
+                                output=CommandOutput(
+                                    stdout='{\n  "bar": "log"\n}\n', stderr=""
+                                ),
+                            ),
+                            Test(
+                                "doesn't show aliases from files included by the configured location",
+                                ["git-alias.sh", "--shell"],
+                                including_file,
+                                exit_code=0,
+                                output=CommandOutput(
+                                    stdout="git alias foo 'diff'\n", stderr=""
+                                ),
+                            ),
+                        ],
+                    )
+                ],
+            )
+        ],
+    )
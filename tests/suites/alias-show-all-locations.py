@@ -28,6 +28,14 @@ def get_suite() -> Suite:
     config_tests: list[Test] = []
     cli_tests: list[Test] = []
 
+    # Keep Git from finding a repository above the context's directory.
+    no_repo = GitExecutionContext()
+
+    no_repo.env["GIT_CEILING_DIRECTORIES"] = str(no_repo.base_dir.parent)
+    no_repo.execute_command(
+        ["git", "config", "--global", "git-alias.config-file", "--local"]
+    )
+
     for setting, location_name in CONFIG_LOCATIONS.items():
         context = GitExecutionContext()
 
@@ -91,7 +99,17 @@ def get_suite() -> Suite:
                             Suite("from Git settings", config_tests),
                             Suite("on the command line", cli_tests),
                         ],
-                    )
+                    ),
+                    Test(
+                        "complains when the configured location is a repository's outside of one",
+                        ["sh", "-c", 'cd .. && exec "$@"', "sh", "git-alias.sh"],
+                        no_repo,
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="fatal: --local can only be used inside a git repository\n",
+                        ),
+                    ),
                 ],
             )
         ],
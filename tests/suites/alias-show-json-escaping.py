@@ -0,0 +1,58 @@
+from testlib import CommandOutput, Suite, Test
+
+
+# Every character which must be escaped in a JSON string (other than carriage
+# returns, which Git doesn't preserve), along with some which mustn't.
+BODY = (
+    "!echo "
+    + "".join(chr(code) for code in range(1, 32) if code != 13)
+    + '"\\/\x7f é ☃ %s'
+)
+
+ESCAPED_BODY = (
+    '"!echo \\u0001\\u0002\\u0003\\u0004\\u0005\\u0006\\u0007\\b\\t\\n\\u000b\\f'
+    "\\u000e\\u000f\\u0010\\u0011\\u0012\\u0013\\u0014\\u0015\\u0016\\u0017"
+    "\\u0018\\u0019\\u001a\\u001b\\u001c\\u001d\\u001e\\u001f"
+    '\\"\\\\/\x7f é ☃ %s"'
+)
+
+
+def get_suite() -> Suite:
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "JSON escaping",
+                [
+                    Test(
+                        "--json flag",
+                        ["git-alias.sh", "--global", "--json"],
+                        define_aliases={("--global",): {"ctl": BODY}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=f'{{\n  "ctl": {ESCAPED_BODY}\n}}\n', stderr=""
+                        ),
+                    ),
+                    Test(
+                        "--json-compact flag",
+                        ["git-alias.sh", "--global", "--json-compact"],
+                        define_aliases={("--global",): {"ctl": BODY}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=f'{{"ctl":{ESCAPED_BODY}}}', stderr=""
+                        ),
+                    ),
+                    Test(
+                        "--ndjson flag",
+                        ["git-alias.sh", "--global", "--ndjson"],
+                        define_aliases={("--global",): {"ctl": BODY}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=f'{{"name":"ctl","body":{ESCAPED_BODY}}}\n',
+                            stderr="",
+                        ),
+                    ),
+                ],
+            )
+        ],
+    )
@@ -0,0 +1,71 @@
+from testlib import COMMON_ALIASES, CommandOutput, Suite, Test
+
+
+def get_suite() -> Suite:
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--show",
+                [
+                    Test(
+                        "shows each of the named aliases",
+                        ["git-alias.sh", "--global", "--show", "func", "foo"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\ngit alias func '!f() {}; f'\n",
+                            stderr="",
+                        ),
+                    ),
+                    Test(
+                        "shows each of the named aliases from the configured location",
+                        ["git-alias.sh", "--json-compact", "--show", "func", "foo"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout='{"foo":"diff","func":"!f() {}; f"}', stderr=""
+                        ),
+                    ),
+                    Test(
+                        "shows the aliases which exist and complains about the rest",
+                        ["git-alias.sh", "--global", "--show", "foo", "a", "b"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\n",
+                            stderr='No alias named "a" exists.\nNo alias named "b" exists.\n',
+                        ),
+                    ),
+                    Test(
+                        "prints nothing else when none of the named aliases exist",
+                        ["git-alias.sh", "--global", "--json", "--show", "a", "b"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr='No alias named "a" exists.\nNo alias named "b" exists.\n',
+                        ),
+                    ),
+                    Test(
+                        "ignores case in alias names",
+                        ["git-alias.sh", "--global", "--show", "FOO"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="git alias foo 'diff'\n", stderr=""
+                        ),
+                    ),
+                    Test(
+                        "doesn't treat alias names as patterns",
+                        ["git-alias.sh", "--global", "--show", "f.*"],
+                        define_aliases={("--global",): COMMON_ALIASES},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="", stderr='No alias named "f.*" exists.\n'
+                        ),
+                    ),
+                ],
+            )
+        ],
+    )
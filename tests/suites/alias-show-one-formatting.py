@@ -19,6 +19,8 @@ TEST_PARAMETERS = [
     TestParameters(["--json"], '{\n  "func": "!f() {}; f"\n}\n', "{}\n"),
     TestParameters(["--json-compact"], '{"func":"!f() {}; f"}', "{}"),
     TestParameters(["--names-only"], "func\n", ""),
+    TestParameters(["--ndjson"], '{"name":"func","body":"!f() {}; f"}\n', ""),
+    TestParameters(["--null"], "func\0!f() {}; f\0", ""),
 ]
 
 
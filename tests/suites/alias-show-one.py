@@ -16,7 +16,32 @@ def get_suite() -> Suite:
                             stdout="",
                             stderr='No alias named "does-not-exist" exists.\n',
                         ),
-                    )
+                    ),
+                    Test(
+                        "prints nothing else when the named alias doesn't exist",
+                        ["git-alias.sh", "--global", "--json", "does-not-exist"],
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr='No alias named "does-not-exist" exists.\n',
+                        ),
+                    ),
+                    Test(
+                        "supports bodies which look like other aliases",
+                        ["git-alias.sh", "--global", "--json", "ml"],
+                        define_aliases={("--global",): {"ml": "!echo\nalias.foo bar"}},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout='{\n  "ml": "!echo\\nalias.foo bar"\n}\n', stderr=""
+                        ),
+                    ),
+                    Test(
+                        "escapes backslashes in the config format",
+                        ["git-alias.sh", "--global", "--config-no-header", "bs"],
+                        define_aliases={("--global",): {"bs": "!echo a\\b"}},
+                        exit_code=0,
+                        output=CommandOutput(stdout='bs = "!echo a\\\\b"\n', stderr=""),
+                    ),
                 ],
             )
         ],
@@ -0,0 +1,129 @@
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+SOURCE = '[alias]\n\tfoo = log\n\tml = "!echo foo\\necho bar"\n\tnew = "!echo hi"\n'
+TARGET = {"foo": "diff", "ml": "!echo foo\necho bar", "st": "status"}
+SYNCED = {"foo": "log", "ml": "!echo foo\necho bar", "new": "!echo hi"}
+
+
+def get_suite() -> Suite:
+    contexts = [GitExecutionContext() for _ in range(4)]
+    sources = [str(context.base_dir / "source") for context in contexts]
+
+    for source in sources:
+        with open(source, "w") as file:
+            file.write(SOURCE)
+
+    return Suite(
+        "alias",
+        [
+            Suite(
+                "--sync-from",
+                [
+                    Test(
+                        "adds, changes, and unsets aliases as needed",
+                        [
+                            "git-alias.sh",
+                            "--global",
+                            "--sync-from",
+                            sources[0],
+                            "--format",
+                            "config",
+                        ],
+                        contexts[0],
+                        define_aliases={("--global",): TARGET},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="'change foo'\n'add new'\n'unset st'\n", stderr=""
+                        ),
+                        aliases={("--global",): SYNCED},
+                    ),
+                    Test(
+                        "does nothing when the aliases already match",
+                        [
+                            "git-alias.sh",
+                            "--global",
+                            "--sync-from",
+                            sources[0],
+                            "--format",
+                            "config",
+                        ],
+                        contexts[0],
+                        exit_code=0,
+                        output=CommandOutput(stdout="", stderr=""),
+                        aliases={("--global",): SYNCED},
+                    ),
+                    Test(
+                        "only reports the edits with --dry-run",
+                        [
+                            "git-alias.sh",
+                            "--global",
+                            "--dry-run",
+                            "--sync-from",
+                            sources[1],
+                            "--format",
+                            "config",
+                        ],
+                        contexts[1],
+                        define_aliases={("--global",): TARGET},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=(
+                                "[dry-run] 'change foo'\n"
+                                "[dry-run] 'add new'\n"
+                                "[dry-run] 'unset st'\n"
+                            ),
+                            stderr="",
+                        ),
+                        aliases={("--global",): TARGET},
+                    ),
+                    Test(
+                        "changes nothing when the source is invalid",
+                        ["git-alias.sh", "--global", "--sync-from", sources[2]],
+                        contexts[2],
+                        define_aliases={("--global",): TARGET},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="Line 1 is not a `git alias <name> <body>` command.\n",
+                        ),
+                        aliases={("--global",): TARGET},
+                    ),
+                    Test(
+                        "complains when the source can't be read",
+                        ["git-alias.sh", "--global", "--sync-from", "does-not-exist"],
+                        contexts[3],
+                        define_aliases={("--global",): TARGET},
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="", stderr='Could not read "does-not-exist".\n'
+                        ),
+                        aliases={("--global",): TARGET},
+                    ),
+                ],
+            ),
+            Suite(
+                "--dry-run",
+                [
+                    Test(
+                        f"refuses to {name}",
+                        ["git-alias.sh", "--global", "--dry-run", *flags],
+                        define_aliases={("--global",): TARGET},
+                        input=input,
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr="--dry-run can only be used with --sync-from.\n",
+                        ),
+                        aliases={("--global",): TARGET},
+                    )
+                    for name, flags, input in [
+                        ("batch edits", ["--batch"], "unset foo\n"),
+                        ("import", ["--import"], "git alias foo 'show'\n"),
+                        ("move", ["--move", "--to", "--local", "foo"], None),
+                        ("define", ["foo", "show"], None),
+                    ]
+                ],
+            ),
+        ],
+    )
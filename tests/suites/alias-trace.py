@@ -0,0 +1,77 @@
+import re
+
+from testlib import CommandOutput, GitExecutionContext, Suite, Test
+
+
+def trace_events(category: str, *phases: str) -> list[re.Pattern]:
+    """Returns patterns matching a trace which is made up of nothing but events
+    and includes both the beginning and end of each of the named phases."""
+
+    event = (
+        r'\{"name":"[a-z-]+","cat":"' + category + r'","ph":"[BE]","ts":\d+,'
+        r'"pid":\d+,"tid":\d+(,"args":\{"approx_system_processes":\d+\})?\}\n'
+    )
+    process_name = (
+        r'\{"name":"process_name","ph":"M","pid":\d+,'
+        r'"args":\{"name":"' + category + r'"\}\}\n'
+    )
+
+    return [
+        re.compile(f"^{process_name}({event})+$"),
+        *(
+            re.compile(f'"name":"{phase}","cat":"{category}","ph":"{kind}"')
+            for phase in phases
+            for kind in "BE"
+        ),
+    ]
+
+
+def get_suite() -> Suite:
+    contexts = [GitExecutionContext() for _ in range(3)]
+
+    for context in contexts:
+        context.env["GIT_ALIAS_TRACE"] = "1"
+
+    return Suite(
+        "GIT_ALIAS_TRACE",
+        [
+            Test(
+                "traces displaying aliases",
+                ["git-alias.sh"],
+                contexts[0],
+                define_aliases={("--global",): {"foo": "diff"}},
+                exit_code=0,
+                output=CommandOutput(
+                    stdout="git alias foo 'diff'\n",
+                    stderr=trace_events("git-alias", "read-config", "format"),
+                ),
+            ),
+            Test(
+                "traces defining an alias",
+                ["git-alias.sh", "foo", "diff"],
+                contexts[1],
+                exit_code=0,
+                output=CommandOutput(
+                    stdout="",
+                    stderr=trace_events("git-alias", "resolve-location", "define"),
+                ),
+                aliases={("--global",): {"foo": "diff"}},
+            ),
+            Test(
+                "traces unsetting aliases",
+                ["git-unalias.sh", "f*"],
+                contexts[2],
+                define_aliases={
+                    ("--global",): {"foo": "diff", "fob": "log", "st": "status"}
+                },
+                exit_code=0,
+                output=CommandOutput(
+                    stdout="'unset foo'\n'unset fob'\n",
+                    stderr=trace_events(
+                        "git-unalias", "resolve-location", "match", "rewrite"
+                    ),
+                ),
+                aliases={("--global",): {"st": "status"}},
+            ),
+        ],
+    )
@@ -0,0 +1,106 @@
+from testlib import (
+    COMMON_ALIASES,
+    CommandOutput,
+    GitExecutionContext,
+    Suite,
+    Test,
+    pick,
+)
+
+
+SCOPES: list[tuple[str, ...]] = [("--system",), ("--global",), ("--local",)]
+
+ALL_ALIASES: dict[tuple[str, ...], dict[str, str]] = {
+    location_flags: COMMON_ALIASES for location_flags in SCOPES
+}
+
+
+def get_suite() -> Suite:
+    contexts = [GitExecutionContext() for _ in range(4)]
+
+    for context in contexts:
+        # These aliases aren't in any of the scopes, so should always remain.
+        context.add_aliases(("--file", "../gitconfig-unused"), COMMON_ALIASES)
+
+    system_path = contexts[0].base_dir / "gitconfig-system"
+    global_path = contexts[0].base_dir / "gitconfig-global"
+
+    return Suite(
+        "unalias",
+        [
+            Suite(
+                "--all-scopes",
+                [
+                    Test(
+                        "removes matching aliases from every scope",
+                        ["git-unalias.sh", "--all-scopes", "ml", "fo*"],
+                        contexts[0],
+                        define_aliases=ALL_ALIASES,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=(
+                                f"'unset ml' (system: {system_path})\n"
+                                f"'unset foo' (system: {system_path})\n"
+                                f"'unset ml' (global: {global_path})\n"
+                                f"'unset foo' (global: {global_path})\n"
+                                "'unset ml' (local: .git/config)\n"
+                                "'unset foo' (local: .git/config)\n"
+                            ),
+                            stderr="",
+                        ),
+                        aliases={
+                            **{
+                                location_flags: pick(COMMON_ALIASES, ["func"])
+                                for location_flags in SCOPES
+                            },
+                            ("--file", "../gitconfig-unused"): COMMON_ALIASES,
+                        },
+                    ),
+                    Test(
+                        "only removes aliases from the scopes they're in",
+                        ["git-unalias.sh", "--all-scopes", "ml"],
+                        contexts[1],
+                        define_aliases={("--local",): COMMON_ALIASES},
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout="'unset ml' (local: .git/config)\n", stderr=""
+                        ),
+                        aliases={
+                            ("--local",): pick(COMMON_ALIASES, ["foo", "func"]),
+                            ("--file", "../gitconfig-unused"): COMMON_ALIASES,
+                        },
+                    ),
+                    Test(
+                        "doesn't remove any aliases with --dry-run",
+                        ["git-unalias.sh", "--all-scopes", "--dry-run", "ml"],
+                        contexts[2],
+                        define_aliases=ALL_ALIASES,
+                        exit_code=0,
+                        output=CommandOutput(
+                            stdout=(
+                                "[dry-run] 'unset ml' (system:"
+                                f" {contexts[2].base_dir / 'gitconfig-system'})\n"
+                                "[dry-run] 'unset ml' (global:"
+                                f" {contexts[2].base_dir / 'gitconfig-global'})\n"
+                                "[dry-run] 'unset ml' (local: .git/config)\n"
+                            ),
+                            stderr="",
+                        ),
+                        aliases=ALL_ALIASES,
+                    ),
+                    Test(
+                        "complains when a pattern doesn't match in any scope",
+                        ["git-unalias.sh", "--all-scopes", "no-such-alias"],
+                        contexts[3],
+                        define_aliases=ALL_ALIASES,
+                        exit_code=1,
+                        output=CommandOutput(
+                            stdout="",
+                            stderr='No aliases matching "no-such-alias" were found.\n',
+                        ),
+                        aliases=ALL_ALIASES,
+                    ),
+                ],
+            )
+        ],
+    )
@@ -1,9 +1,65 @@
+import os
 import re
 
-from testlib import COMMON_ALIASES, CommandOutput, Suite, Test, pick
+from testlib import (
+    COMMON_ALIASES,
+    CommandOutput,
+    GitExecutionContext,
+    Suite,
+    Test,
+    pick,
+)
 
 
 def get_suite() -> Suite:
+    # Git's lock can't be taken while aliases are being defined, so the file is
+    # written directly.
+    locked = GitExecutionContext()
+
+    (locked.base_dir / "gitconfig-global").write_text(
+        "[alias]\n\tfoo = diff\n\tml = log\n"
+    )
+    (locked.base_dir / "gitconfig-global.lock").touch()
+
+    repeated = GitExecutionContext()
+
+    (repeated.base_dir / "gitconfig-global").write_text(
+        "[alias]\n\tfoo = diff\n\tml = log\n[alias]\n\tfoo = show\n"
+    )
+
+    everything = GitExecutionContext()
+    everything_path = everything.base_dir / "gitconfig-global"
+
+    everything_path.write_text(
+        "[alias]\n\tfoo = diff\n[user]\n\tname = Test\n[alias]\n\tml = log\n[alias]\n"
+    )
+
+    mixed_case = GitExecutionContext()
+
+    (mixed_case.base_dir / "gitconfig-global").write_text(
+        "[alias]\n\tfoo = diff\n[Alias]\n\tml = log\n"
+    )
+
+    upper_case = GitExecutionContext()
+
+    (upper_case.base_dir / "gitconfig-global").write_text(
+        "[ALIAS]\n\tfoo = diff\n\tml = log\n"
+    )
+
+    subsection = GitExecutionContext()
+
+    (subsection.base_dir / "gitconfig-global").write_text(
+        '[alias]\n\tfoo = diff\n\tml = log\n[alias "sub"]\n\tfoo = show\n'
+    )
+
+    # Git can't be asked for a file's permissions, so they're listed by the
+    # command itself.
+    private = GitExecutionContext()
+    private_path = private.base_dir / "gitconfig-global"
+
+    private_path.write_text("[alias]\n\tfoo = diff\n\tml = log\n")
+    os.chmod(private_path, 0o600)
+
     return Suite(
         "unalias",
         [
@@ -61,5 +117,132 @@ def get_suite() -> Suite:
                 ),
                 aliases={("--global",): COMMON_ALIASES},
             ),
+            Test(
+                "doesn't remove any aliases if the file can't be rewritten",
+                ["git-unalias.sh", "--global", "f*", "m*"],
+                locked,
+                exit_code=1,
+                output=CommandOutput(
+                    stdout="",
+                    stderr=re.compile(
+                        "^Could not lock config file .*\nFailed to unset the"
+                        " aliases which matched, so none were unset.\n$"
+                    ),
+                ),
+                aliases={("--global",): {"foo": "diff", "ml": "log"}},
+            ),
+            Test(
+                "doesn't remove a single alias if the file can't be rewritten",
+                ["git-unalias.sh", "--global", "foo"],
+                locked,
+                exit_code=1,
+                output=CommandOutput(
+                    stdout="",
+                    stderr=re.compile(
+                        "^error: could not lock config file .*\nFailed to unset"
+                        " the aliases which matched, so none were unset.\n$"
+                    ),
+                ),
+                aliases={("--global",): {"foo": "diff", "ml": "log"}},
+            ),
+            Test(
+                "removes every definition of an alias defined more than once",
+                ["git-unalias.sh", "--global", "foo"],
+                repeated,
+                exit_code=0,
+                output=CommandOutput(stdout="'unset foo'\n", stderr=""),
+                aliases={("--global",): {"ml": "log"}},
+            ),
+            Test(
+                "removes the whole section when every alias matches",
+                ["git-unalias.sh", "--global", "ml", "*"],
+                everything,
+                exit_code=0,
+                output=CommandOutput(stdout="'unset ml'\n'unset foo'\n", stderr=""),
+                aliases={("--global",): {}},
+            ),
+            Test(
+                "removes every alias from sections spelled in another case",
+                ["git-unalias.sh", "--global", "*"],
+                mixed_case,
+                exit_code=0,
+                output=CommandOutput(stdout="'unset foo'\n'unset ml'\n", stderr=""),
+                aliases={("--global",): {}},
+            ),
+            Test(
+                "removes every alias from an upper-case section",
+                ["git-unalias.sh", "--global", "*"],
+                upper_case,
+                exit_code=0,
+                output=CommandOutput(stdout="'unset foo'\n'unset ml'\n", stderr=""),
+                aliases={("--global",): {}},
+            ),
+            Test(
+                "leaves aliases in subsections alone",
+                ["git-unalias.sh", "--global", "*"],
+                subsection,
+                exit_code=0,
+                output=CommandOutput(stdout="'unset foo'\n'unset ml'\n", stderr=""),
+                aliases={("--global",): {"sub.foo": "show"}},
+            ),
+            Test(
+                "keeps the file's permissions",
+                [
+                    "sh",
+                    "-c",
+                    'git-unalias.sh --global foo && ls -l "$GIT_CONFIG_GLOBAL"',
+                ],
+                private,
+                exit_code=0,
+                output=CommandOutput(
+                    stdout=re.compile(r"^'unset foo'\n-rw------- "), stderr=""
+                ),
+                aliases={("--global",): {"ml": "log"}},
+            ),
+            Test(
+                "supports character classes",
+                ["git-unalias.sh", "--global", "[[:alpha:]]l", "*[[:digit:]]"],
+                define_aliases={("--global",): {**COMMON_ALIASES, "v2": "log"}},
+                exit_code=0,
+                output=CommandOutput(stdout="'unset ml'\n'unset v2'\n", stderr=""),
+                aliases={("--global",): pick(COMMON_ALIASES, ["foo", "func"])},
+            ),
+            Test(
+                "only unsets each alias for the first pattern it matches",
+                ["git-unalias.sh", "--global", "f*", "fo*"],
+                define_aliases={("--global",): COMMON_ALIASES},
+                exit_code=1,
+                output=CommandOutput(
+                    stdout="'unset foo'\n'unset func'\n",
+                    stderr='No aliases matching "fo*" were found.\n',
+                ),
+                aliases={("--global",): pick(COMMON_ALIASES, ["ml"])},
+            ),
+            Test(
+                "treats characters other than wildcards literally",
+                ["git-unalias.sh", "--global", "f.o", "m+", "fu(nc)"],
+                define_aliases={("--global",): COMMON_ALIASES},
+                exit_code=1,
+                output=CommandOutput(
+                    stdout="",
+                    stderr=(
+                        'No aliases matching "f.o" were found.\n'
+                        'No aliases matching "m+" were found.\n'
+                        'No aliases matching "fu(nc)" were found.\n'
+                    ),
+                ),
+                aliases={("--global",): COMMON_ALIASES},
+            ),
+            Test(
+                "matches escaped wildcards literally",
+                ["git-unalias.sh", "--global", "f\\*", "m[l]"],
+                define_aliases={("--global",): COMMON_ALIASES},
+                exit_code=1,
+                output=CommandOutput(
+                    stdout="'unset ml'\n",
+                    stderr='No aliases matching "f\\*" were found.\n',
+                ),
+                aliases={("--global",): pick(COMMON_ALIASES, ["foo", "func"])},
+            ),
         ],
     )
@@ -14,17 +14,23 @@ from types import TracebackType
 from typing import ClassVar, Hashable, Iterable, Mapping, Sequence, Type, TypeVar
 import weakref
 
-
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
 _TESTS_DIR = (Path.cwd() / Path(__file__)).resolve().parent
-_SCRIPTS_DIR = _TESTS_DIR.parent
+# The scripts under test can be replaced by another copy (such as the bundled
+# ones built by the Makefile) by naming its directory in this variable.
+_SCRIPTS_DIR = (
+    Path(os.environ["GIT_ALIAS_TEST_SCRIPTS_DIR"]).resolve()
+    if "GIT_ALIAS_TEST_SCRIPTS_DIR" in os.environ
+    else _TESTS_DIR.parent
+)
 _TEMP_ROOT = _TESTS_DIR / "tmp"
 
 ALIAS_COMMANDS = {
     "symlink with absolute path": ["git", "alias-abs"],
     "symlink with relative path": ["git", "alias-rel"],
+    "symlink to a symlink": ["git", "alias-chain"],
     "no symlink": ["git-alias.sh"],
 }
 
@@ -159,6 +165,7 @@ class GitExecutionContext:
 
         os.symlink(_SCRIPTS_DIR / "git-alias.sh", self.bin_dir / "git-alias-abs")
         os.symlink(scripts_dir_rel / "git-alias.sh", self.bin_dir / "git-alias-rel")
+        os.symlink("git-alias-rel", self.bin_dir / "git-alias-chain")
         os.symlink(_SCRIPTS_DIR / "git-unalias.sh", self.bin_dir / "git-unalias-abs")
         os.symlink(scripts_dir_rel / "git-unalias.sh", self.bin_dir / "git-unalias-rel")
 
@@ -203,7 +210,12 @@ class GitExecutionContext:
             )
 
     def execute_command(
-        self, command: Sequence[str], *, cwd: Path | None = None, check: bool = False
+        self,
+        command: Sequence[str],
+        *,
+        cwd: Path | None = None,
+        check: bool = False,
+        input: str | None = None,
     ) -> subprocess.CompletedProcess[str]:
         cwd = cwd if cwd is not None else self.repo_dir
 
@@ -212,7 +224,8 @@ class GitExecutionContext:
             cwd=cwd,
             env=self.env,
             text=True,
-            stdin=subprocess.DEVNULL,
+            input=input,
+            stdin=subprocess.DEVNULL if input is None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=check,
@@ -490,6 +503,9 @@ class Test:
     are {name: definition} mappings of aliases to define.
     """
 
+    input: str | None = field(default=None, kw_only=True)
+    """If set, text to supply to the command on its stdin."""
+
     exit_code: int | None = field(default=None, kw_only=True)
     """If set, the exit code expected from executing Git.
 
@@ -521,7 +537,7 @@ class Test:
         for location_flags, aliases in self.define_aliases.items():
             self.context.add_aliases(location_flags, aliases)
 
-        result = self.context.execute_command(self.command_line)
+        result = self.context.execute_command(self.command_line, input=self.input)
 
         if self.exit_code is not None and result.returncode != self.exit_code:
             report.failures.append(
@@ -0,0 +1,115 @@
+# Copies a shell script (the first operand) to stdout, replacing its
+# `load_common` function with the contents of the shell script that function
+# sources (which holds the helpers it shares with the other script), and the
+# `load_awk` function in that with one which has the contents of the awk scripts
+# named by the remaining operands built in. This produces a single file which
+# can be installed on its own and doesn't need to read any other files when it
+# runs.
+
+BEGIN {
+  for (i = 2; i < ARGC; i++) {
+    awk_scripts[i - 1] = ARGV[i]
+    delete ARGV[i]
+  }
+
+  awk_script_count = ARGC - 2
+
+  # The sourced script is found in the same directory as the first one.
+  script_dir = ARGV[1]
+  sub(/[^\/]*$/, "", script_dir)
+
+  copy_script(ARGV[1])
+
+  exit
+}
+
+## Turn any string into a shell-style single-quoted string.
+function quote(string) {
+  gsub(/'/, "'\\''", string)
+
+  return "'" string "'"
+}
+
+## Returns the contents of a file, minus its final newline (as with command
+## substitution in the shell).
+function read_file(path,    contents, line, status) {
+  contents = ""
+
+  while ((status = (getline line < path)) > 0) {
+    contents = contents line "\n"
+  }
+
+  if (status < 0) {
+    print "Couldn't read \"" path "\"." > "/dev/stderr"
+
+    exit 1
+  }
+
+  close(path)
+
+  return substr(contents, 1, length(contents) - 1)
+}
+
+## Prints a `load_awk` function which has the awk scripts built in.
+function print_load_awk(    name, i) {
+  print "load_awk() {"
+  print "  awk_program="
+  print ""
+  print "  for awk_script in \"$@\"; do"
+  print "    case \"$awk_script\" in"
+
+  for (i = 1; i <= awk_script_count; i++) {
+    name = awk_scripts[i]
+    sub(/.*\//, "", name)
+
+    print "      " name " ) awk_program=\"$awk_program"
+    print "\"" quote(read_file(awk_scripts[i])) ";;"
+  }
+
+  print "      * ) >&2 echo \"Unknown awk script \\\"$awk_script\\\". How did you do that?\"; exit 1;;"
+  print "    esac"
+  print "  done"
+  print "}"
+}
+
+## Copies the shell script at the given path to stdout, replacing the functions
+## described above (along with the call to `load_common`).
+function copy_script(path,    line, skipping, sourced, status) {
+  skipping = ""
+  sourced = ""
+
+  while ((status = (getline line < path)) > 0) {
+    if (skipping) {
+      # The script sourced by `load_common` is named by the only line which
+      # sources anything from the script's directory.
+      if (skipping == "load_common" && match(line, /^ *\. "\$script_dir\/[^"]*"$/)) {
+        sourced = substr(line, RSTART, RLENGTH)
+        sub(/^ *\. "\$script_dir\//, "", sourced)
+        sub(/"$/, "", sourced)
+      }
+
+      if (line == "}") {
+        if (skipping == "load_common") {
+          copy_script(script_dir sourced)
+        }
+
+        skipping = ""
+      }
+    } else if (line == "load_awk() {") {
+      print_load_awk()
+      skipping = "load_awk"
+    } else if (line == "load_common() {") {
+      skipping = "load_common"
+    } else if (line != "load_common") {
+      print line
+    }
+  }
+
+  if (status < 0) {
+    print "Couldn't read \"" path "\"." > "/dev/stderr"
+
+    exit 1
+  }
+
+  close(path)
+}
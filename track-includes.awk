@@ -0,0 +1,60 @@
+# Works out which configuration files were included by which from the entries
+# in the output of `git config --list --show-origin` (with or without
+# `--show-scope`), which must be passed to `track_includes` one at a time, in
+# order. Afterward, the following globals describe the entry's file:
+#
+# - `include_depth` is 0 if the file was read on its own, or how deeply nested
+#   the include directive which brought it in was otherwise.
+# - `include_count[origin]` is the number of times the file has been included
+#   so far (so it is 1 while the first copy of its entries are being read).
+#
+# Included files are tracked using a stack, as they may themselves include
+# other files. A new origin is only an included file if it immediately follows
+# an include directive which refers to it; otherwise, it must be one of the
+# files already on the stack (or a new top-level file).
+
+## Works out which file an include directive (whose value is `path`) in the
+## configuration file `origin` refers to, the same way Git does.
+function resolve_include(path, origin) {
+  if (substr(path, 1, 2) == "~/") {
+    return ENVIRON["HOME"] substr(path, 2)
+  }
+
+  if (substr(path, 1, 1) == "/") {
+    return path
+  }
+
+  # Relative paths are relative to the directory containing the file with the
+  # include directive.
+  sub(/[^\/]*$/, "", origin)
+
+  return origin path
+}
+
+## Updates the globals describing included files for an entry with the given
+## origin, key, and value.
+function track_includes(origin, key, value) {
+  if (origin != previous_origin) {
+    if (origin == included_origin) {
+      include_stack[++include_depth] = origin
+
+      if (origin in include_count) {
+        include_count[origin]++
+      } else {
+        include_count[origin] = 1
+      }
+    } else {
+      while (include_depth > 0 && include_stack[include_depth] != origin) {
+        include_depth--
+      }
+    }
+
+    previous_origin = origin
+  }
+
+  included_origin = ""
+
+  if (key ~ /^include(if\..*)?\.path$/ && substr(origin, 1, 5) == "file:") {
+    included_origin = "file:" resolve_include(value, substr(origin, 6))
+  }
+}
@@ -0,0 +1,8 @@
+# Reads the names of aliases to remove from stdin, one per line, and passes each
+# of them to `unset_alias` (which is provided by rewrite-config.awk, which must
+# follow this script), so that all of them are removed in a single rewrite of
+# the configuration file.
+
+{
+  unset_alias($0)
+}